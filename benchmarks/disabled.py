@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the cost of disabled spinners against an empty context manager
+"""
+import contextlib
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from halo import Halo
+
+NUMBER = 200000
+
+
+def null_block():
+    """Run an empty context manager"""
+    with contextlib.nullcontext() as spinner:
+        spinner = 'Processing'
+
+
+def disabled_block():
+    """Run a disabled spinner, updating its text once"""
+    with Halo(text='Processing', enabled=False) as spinner:
+        spinner.text = 'Processing file.py'
+
+
+def disabled_succeed():
+    """Run a disabled spinner to success"""
+    spinner = Halo(text='Processing', enabled=False).start()
+    spinner.text = 'Processing file.py'
+    spinner.succeed()
+
+
+if __name__ == '__main__':
+    timings = [
+        ('nullcontext block', null_block),
+        ('Halo(enabled=False) block', disabled_block),
+        ('Halo(enabled=False) succeed', disabled_succeed),
+        ('Halo(enabled=False)', lambda: Halo(text='Processing', enabled=False)),
+    ]
+
+    os.environ['HALO_DISABLE'] = '1'
+    timings.append(('Halo() with HALO_DISABLE=1', lambda: Halo(text='Processing')))
+
+    baseline = None
+    for name, statement in timings:
+        seconds = min(timeit.repeat(statement, number=NUMBER, repeat=5)) / NUMBER
+        baseline = baseline or seconds
+        print('{0:<32}{1:>10.1f} ns{2:>8.1f}x'.format(name, seconds * 1e9, seconds / baseline))
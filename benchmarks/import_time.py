@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the time `import halo` takes, using `python -X importtime`
+"""
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 20
+TOP = 10
+
+_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)')
+
+
+def import_times(statement):
+    """Run the statement in a fresh interpreter and collect the import times.
+
+    Parameters
+    ----------
+    statement : str
+        Python statement to run
+
+    Returns
+    -------
+    dict
+        Cumulative microseconds spent importing each module
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=ROOT,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2))
+    return times
+
+
+if __name__ == '__main__':
+    runs = [import_times('import halo') for _ in range(RUNS)]
+    totals = [run['halo'] for run in runs]
+
+    print('import halo: median {0:.1f} ms, min {1:.1f} ms over {2} runs'.format(
+        statistics.median(totals) / 1000.0, min(totals) / 1000.0, RUNS))
+
+    print('\nslowest imports (cumulative):')
+    last = runs[-1]
+    for module in sorted(last, key=last.get, reverse=True)[:TOP]:
+        print('  {0:<32}{1:>8.1f} ms'.format(module, last[module] / 1000.0))
+
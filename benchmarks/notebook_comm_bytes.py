@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the bytes HaloNotebook sends to the frontend per minute of spinning
+"""
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ipywidgets import Widget
+
+from halo import HaloNotebook
+
+SECONDS = 60
+
+
+class AppendingHaloNotebook(HaloNotebook):
+    """HaloNotebook appending every frame to the outputs, as it used to"""
+
+    def _render_frame(self):
+        with self.output:
+            self.output.outputs += self._output("\r{0}".format(self.frame()))
+
+
+def comm_traffic(spinner_class, **kwargs):
+    """Render a minute of frames and measure the messages sent to the frontend.
+
+    Parameters
+    ----------
+    spinner_class : type
+        Class of the spinner
+    **kwargs
+        Further arguments of the spinner
+
+    Returns
+    -------
+    tuple
+        Number of messages and bytes sent
+    """
+    spinner = spinner_class(text='Processing', spinner='dots', **kwargs)
+    spinner.output = spinner._make_output_widget()
+    traffic = [0, 0]
+
+    def send(widget, msg, buffers=None):
+        traffic[0] += 1
+        traffic[1] += len(json.dumps(msg))
+
+    original_send = Widget._send
+    Widget._send = send
+    try:
+        for _ in range(SECONDS * 1000 // spinner._interval):
+            spinner._render_frame()
+    finally:
+        Widget._send = original_send
+
+    return tuple(traffic)
+
+
+if __name__ == '__main__':
+    for name, spinner_class, kwargs in (
+        ('appending outputs', AppendingHaloNotebook, {}),
+        ('single output slot', HaloNotebook, {}),
+        ('frontend animation', HaloNotebook, {'mode': 'frontend'}),
+    ):
+        messages, sent = comm_traffic(spinner_class, **kwargs)
+        print('{0:<20}{1:>8} messages{2:>14.1f} KiB per minute'.format(
+            name, messages, sent / 1024.0))
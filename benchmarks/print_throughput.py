@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the print throughput of an application using halo, before and
+after halo stopped calling colorama.init(autoreset=True) on sys.stdout
+"""
+import importlib.util
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LINES = 200000
+
+APPLICATION = '''
+import sys
+import time
+
+{setup}
+
+import halo
+halo.Halo(text='foo', stream=sys.stderr, enabled=False).succeed()
+
+started = time.perf_counter()
+for i in range({lines}):
+    print('line', i)
+sys.stdout.flush()
+sys.stderr.write('elapsed=%f\\n' % (time.perf_counter() - started))
+'''
+
+# Name, module the scenario needs and statement run before importing halo
+SCENARIOS = (
+    ('global colorama.init', 'colorama', 'import colorama; colorama.init(autoreset=True)'),
+    ('halo', None, ''),
+)
+
+
+def lines_per_second(setup):
+    """Run an application printing lines to /dev/null.
+
+    Parameters
+    ----------
+    setup : str
+        Statement run by the application before importing halo
+
+    Returns
+    -------
+    float
+        Lines printed per second
+    """
+    with open(os.devnull, 'w') as devnull:
+        result = subprocess.run(
+            [sys.executable, '-c', APPLICATION.format(setup=setup, lines=LINES)],
+            cwd=ROOT,
+            stdout=devnull,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+    elapsed = [line for line in result.stderr.splitlines() if line.startswith('elapsed=')]
+    return LINES / float(elapsed[0][len('elapsed='):])
+
+
+if __name__ == '__main__':
+    for name, module, setup in SCENARIOS:
+        if module is not None and importlib.util.find_spec(module) is None:
+            # colorama is only required on Windows
+            print('{0:<24}{1:>12} ({2} is not installed)'.format(name, 'skipped', module))
+            continue
+        print('{0:<24}{1:>12.0f} lines/s'.format(name, lines_per_second(setup)))
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Benchmark bytes written per second by the `line` and `diff` render modes
+"""
+import io
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from halo import Halo
+
+FRAMES = 1000
+
+
+class ByteCounter(io.StringIO):
+    """A stream counting the encoded bytes written to it"""
+
+    bytes_written = 0
+
+    def write(self, s):
+        self.bytes_written += len(s.encode('utf-8'))
+        return len(s)
+
+
+def bytes_per_second(mode, text):
+    """Render frames as the render thread would and count the bytes written.
+
+    Parameters
+    ----------
+    mode : str
+        Render mode
+    text : callable
+        Returns the spinner text for a given frame number
+
+    Returns
+    -------
+    float
+        Bytes written per second of spinning
+    """
+    stream = ByteCounter()
+    spinner = Halo(stream=stream, mode=mode)
+
+    for i in range(FRAMES):
+        spinner.text = text(i)
+        spinner._render_frame()
+
+    seconds = FRAMES * spinner._interval / 1000.0
+    return stream.bytes_written / seconds
+
+
+SCENARIOS = (
+    ('static text', lambda i: 'Downloading dependencies'),
+    ('counter suffix', lambda i: 'Processed {0} files'.format(i * 37)),
+    ('changing text', lambda i: 'Compiling module_{0}.py'.format('abcdefgh'[i % 8] * 8)),
+)
+
+if __name__ == '__main__':
+    print('{0:<16}{1:>12}{2:>12}{3:>10}'.format('scenario', 'line B/s', 'diff B/s', 'saved'))
+    for name, text in SCENARIOS:
+        line = bytes_per_second('line', text)
+        diff = bytes_per_second('diff', text)
+        print('{0:<16}{1:>12.0f}{2:>12.0f}{3:>9.0f}%'.format(name, line, diff, 100 * (1 - diff / line)))
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the memory allocated to lay out animated text of growing length
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from halo import Halo
+
+LENGTHS = (1000, 10000, 50000, 200000)
+
+
+def layout_cost(animation, length):
+    """Measure setting a text of the given length and rendering a frame.
+
+    Parameters
+    ----------
+    animation : str
+        Text animation
+    length : int
+        Number of characters of the text
+
+    Returns
+    -------
+    tuple
+        Peak bytes allocated besides the text itself and milliseconds spent
+    """
+    spinner = Halo(animation=animation, stream=open(os.devnull, 'w'), mode='line')
+    text = 'x' * length
+
+    # Render an untraced frame first, so the imports, the coordinator of the
+    # stream and the colors set up on first use are not measured
+    spinner.text = 'warm up'
+    spinner._render_frame()
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    spinner.text = text
+    spinner._render_frame()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak, elapsed * 1000
+
+
+if __name__ == '__main__':
+    print('{0:<10}{1:>10}{2:>14}{3:>10}'.format('animation', 'length', 'peak bytes', 'ms'))
+    for animation in ('bounce', 'marquee'):
+        for length in LENGTHS:
+            peak, elapsed = layout_cost(animation, length)
+            print('{0:<10}{1:>10}{2:>14}{3:>10.3f}'.format(animation, length, peak, elapsed))
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""Benchmark updating the spinner text from a hot loop
+"""
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from halo import Halo
+
+NUMBER = 1000000
+
+
+class Plain(object):
+    """An object with a plain text attribute"""
+
+    text = ''
+
+
+if __name__ == '__main__':
+    spinner = Halo(text='Processing', animation='marquee', enabled=False)
+    plain = Plain()
+    texts = ['Processing file_{0}.py'.format(i) for i in range(1000)]
+
+    timings = (
+        ('attribute assignment', lambda: setattr(plain, 'text', texts[7])),
+        ('Halo.text setter', lambda: setattr(spinner, 'text', texts[7])),
+        ('text layout, once per frame', lambda: spinner._get_text(texts[7])),
+    )
+
+    for name, statement in timings:
+        seconds = min(timeit.repeat(statement, number=NUMBER, repeat=5))
+        print('{0:<30}{1:>10.1f} ns'.format(name, seconds / NUMBER * 1e9))
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the overhead `halo.track` adds to every item of a loop
+"""
+import io
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from halo import track
+
+NUMBER = 5000000
+
+
+def loop(iterable):
+    """Iterate without doing any work.
+
+    Parameters
+    ----------
+    iterable : iterable
+        Items to iterate
+
+    Returns
+    -------
+    float
+        Seconds the loop took
+    """
+    start = time.perf_counter()
+    for _ in iterable:
+        pass
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    plain = min(loop(range(NUMBER)) for _ in range(3))
+    tracked = min(
+        loop(track(range(NUMBER), text='items', stream=io.StringIO(), mode='line'))
+        for _ in range(3)
+    )
+
+    print('{0:<20}{1:>10.1f} ns/item'.format('plain loop', plain / NUMBER * 1e9))
+    print('{0:<20}{1:>10.1f} ns/item'.format('halo.track', tracked / NUMBER * 1e9))
+    print('{0:<20}{1:>10.1f} ns/item'.format('overhead', (tracked - plain) / NUMBER * 1e9))
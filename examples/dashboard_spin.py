@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""Example for a dashboard of thousands of concurrent tasks
+"""
+from __future__ import unicode_literals
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from halo import HaloDashboard
+
+dashboard = HaloDashboard(text='Crawling', max_lines=12)
+
+try:
+    dashboard.start()
+    running = [dashboard.add_task('Fetching page {0}'.format(i)) for i in range(5000)]
+    while running:
+        time.sleep(0.01)
+        task = running.pop(random.randrange(min(len(running), 50)))
+        if random.random() < 0.01:
+            dashboard.fail_task(task, 'Fetching failed: {0}'.format(dashboard.task_text(task)))
+        else:
+            dashboard.succeed_task(task)
+    dashboard.succeed('Crawled')
+except (KeyboardInterrupt, SystemExit):
+    dashboard.stop()
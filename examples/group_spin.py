@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""Example for a group of spinners, one line per task
+"""
+from __future__ import unicode_literals
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from halo import HaloGroup
+
+group = HaloGroup(text='Building packages', spinner='dots')
+
+try:
+    group.start()
+    rows = [group.add(text='Building package {0}'.format(i)) for i in range(5)]
+    for i, row in enumerate(rows):
+        time.sleep(1)
+        if i == 3:
+            row.fail('Package {0} failed'.format(i))
+        else:
+            row.succeed('Package {0} built'.format(i))
+    group.succeed('Packages built')
+except (KeyboardInterrupt, SystemExit):
+    group.stop()
@@ -2,9 +2,37 @@
 __author__ = 'Manraj Singh'
 __email__ = 'manrajsinghgrover@gmail.com'
 
+import importlib
 import logging
 
 from .halo import Halo
-from .halo_notebook import HaloNotebook
+
+# Attributes whose modules are only imported on first access, as asyncio and
+# IPython are costly to import and most programs need neither.
+_LAZY_ATTRIBUTES = {
+    "AsyncHalo": ".async_halo",
+    "HaloDashboard": ".halo_dashboard",
+    "HaloGroup": ".halo_group",
+    "HaloLoggingHandler": ".logging_handler",
+    "HaloNotebook": ".halo_notebook",
+    "track": "._track",
+}
+
+__all__ = ["Halo"] + sorted(_LAZY_ATTRIBUTES)
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(
+            "module '{0}' has no attribute '{1}'".format(__name__, name)
+        )
+
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
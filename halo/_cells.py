@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Cell level diffing of rendered lines for the `diff` render mode.
+"""
+import re
+import unicodedata
+
+CLEAR_LINE = "\033[K"
+RESET = "\033[0m"
+
+_SGR = re.compile(r"\033\[[0-9;]*m")
+_RESETS = (RESET, "\033[m")
+
+
+def split_cells(line):
+    """Split a rendered line into cells.
+
+    Parameters
+    ----------
+    line : str
+        Line which may contain SGR (color and style) escape sequences
+
+    Returns
+    -------
+    list
+        Tuples of the SGR sequences active for a cell and its character
+    """
+    cells = []
+    style = ""
+    position = 0
+
+    for match in _SGR.finditer(line):
+        cells.extend((style, char) for char in line[position : match.start()])
+        code = match.group()
+        style = "" if code in _RESETS else style + code
+        position = match.end()
+
+    cells.extend((style, char) for char in line[position:])
+    return cells
+
+
+def is_single_width(cells):
+    """Check whether every cell occupies exactly one terminal column.
+
+    Parameters
+    ----------
+    cells : list
+        Cells as returned by `split_cells`
+
+    Returns
+    -------
+    bool
+        Whether cell indexes can be used as terminal columns
+    """
+    for _, char in cells:
+        if unicodedata.east_asian_width(char) in ("W", "F") or unicodedata.combining(
+            char
+        ):
+            return False
+
+    return True
+
+
+def diff_cells(previous, current):
+    """Build the escape sequences turning the previous line into the current.
+
+    Only changed cells are written, after moving the cursor to their column
+    with CSI n G. Cells past the end of a shorter current line are erased.
+
+    Parameters
+    ----------
+    previous : list
+        Cells already drawn on the line
+    current : list
+        Cells to be drawn
+
+    Returns
+    -------
+    str
+        Characters to write, empty if nothing changed
+    """
+    output = []
+    style = ""
+    column = None
+
+    for index, cell in enumerate(current):
+        if index < len(previous) and previous[index] == cell:
+            continue
+
+        if column != index:
+            output.append("\033[{0}G".format(index + 1))
+
+        cell_style, char = cell
+        if cell_style != style:
+            if style:
+                output.append(RESET)
+            output.append(cell_style)
+            style = cell_style
+
+        output.append(char)
+        column = index + 1
+
+    if style:
+        output.append(RESET)
+
+    if len(current) < len(previous):
+        output.append("\033[{0}G{1}".format(len(current) + 1, CLEAR_LINE))
+
+    return "".join(output)
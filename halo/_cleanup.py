@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Stops running spinners when the interpreter exits or a notebook cell ends.
+"""
+import atexit
+import threading
+import weakref
+
+from halo._utils import get_environment
+
+# Spinners are only weakly referenced, so the registry never keeps one alive
+_running = weakref.WeakSet()
+_lock = threading.Lock()
+_hook_registered = False
+
+
+def track_running(spinner):
+    """Adds a started spinner to the spinners stopped by the cleanup hook.
+    The hook is registered with the first spinner ever started.
+    Parameters
+    ----------
+    spinner : Halo
+        Started spinner
+    """
+    _running.add(spinner)
+
+    if not _hook_registered:
+        _register_hook()
+
+
+def untrack_running(spinner):
+    """Removes a stopped spinner from the spinners stopped by the cleanup hook.
+    Parameters
+    ----------
+    spinner : Halo
+        Stopped spinner
+    """
+    _running.discard(spinner)
+
+
+def stop_running(*args):
+    """Stops every running spinner. Costs one call per running spinner,
+    however many spinners were created.
+    """
+    for spinner in list(_running):
+        spinner.stop()
+
+
+def _register_hook():
+    """Registers `stop_running` to be called after each notebook cell, or at
+    exit in a terminal, once per process.
+    """
+    global _hook_registered
+
+    with _lock:
+        if _hook_registered:
+            return
+
+        if get_environment() in ("ipython", "jupyter"):
+            from IPython import get_ipython
+
+            get_ipython().events.register("post_run_cell", stop_running)
+        else:  # default terminal
+            atexit.register(stop_running)
+
+        _hook_registered = True
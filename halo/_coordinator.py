@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Serialization of the writes of every spinner sharing a stream.
+"""
+import os
+import threading
+import weakref
+
+from collections import deque
+from contextlib import contextmanager
+
+from halo._utils import encode_utf_8_text, get_ansi_stream
+
+# Coordinators by the id of their stream. A coordinator keeps its stream
+# alive, so the id cannot be reused while its entry exists.
+_coordinators = weakref.WeakValueDictionary()
+_coordinators_lock = threading.Lock()
+
+
+class StreamCoordinator(object):
+    """Writes to a stream on behalf of every spinner and thread sharing it.
+
+    Writers queue whole chunks, e.g. frames, and the one holding the lock
+    writes every chunk queued meanwhile with a single call. Chunks are thus
+    never interleaved, however many threads write, and writers arriving
+    while the stream is busy have their chunks written together.
+
+    Parameters
+    ----------
+    stream : io
+        Stream written to
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._reset()
+
+    def _reset(self):
+        """Drops the queued chunks and replaces the lock, e.g. in a freshly
+        forked child, where the lock may have been held by a thread of the parent.
+        """
+        self._pending = deque()
+        self._lock = threading.Lock()
+
+    def write(self, s, flush=False):
+        """Writes the chunk, along with those queued by other writers.
+        Parameters
+        ----------
+        s : str
+            Chunk to write
+        flush : bool, optional
+            Flush the stream once written
+        """
+        self._pending.append((s, flush))
+        with self._lock:
+            self._drain()
+
+    def flush(self):
+        """Writes the queued chunks, if any, and flushes the stream.
+        """
+        with self._lock:
+            self._drain()
+            self._flush()
+
+    @contextmanager
+    def exclusive(self):
+        """Holds the stream, after writing the queued chunks, so escape codes
+        written by other means, e.g. by `halo.cursor`, are not interleaved.
+        Yields
+        ------
+        io
+            Stream written to
+        """
+        with self._lock:
+            self._drain()
+            yield self.stream
+
+    def _drain(self):
+        chunks = []
+        flush = False
+        while True:
+            try:
+                s, chunk_flush = self._pending.popleft()
+            except IndexError:
+                break
+            chunks.append(s)
+            flush = flush or chunk_flush
+
+        if not chunks:
+            # Written by the previous holder of the lock
+            return
+
+        output = "".join(chunks)
+        try:
+            self.stream.write(output)
+        except UnicodeEncodeError:
+            self.stream.write(encode_utf_8_text(output))
+
+        if flush:
+            self._flush()
+
+    def _flush(self):
+        try:
+            flush = self.stream.flush
+        except AttributeError:
+            return
+
+        flush()
+
+
+def coordinator_for(stream):
+    """Returns the coordinator shared by everything writing to the stream.
+    Parameters
+    ----------
+    stream : io
+        Stream to be written to
+    Returns
+    -------
+    StreamCoordinator
+        Coordinator of the stream, writing to it through `get_ansi_stream`
+    """
+    with _coordinators_lock:
+        coordinator = _coordinators.get(id(stream))
+        if coordinator is None:
+            coordinator = StreamCoordinator(get_ansi_stream(stream))
+            _coordinators[id(stream)] = coordinator
+        return coordinator
+
+
+def _reset():
+    """Replaces the locks of the coordinators in a freshly forked child."""
+    global _coordinators_lock
+
+    _coordinators_lock = threading.Lock()
+    for coordinator in list(_coordinators.values()):
+        coordinator._reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Interception of writes to `sys.stdout` and `sys.stderr` while a spinner runs.
+"""
+import sys
+import threading
+
+STREAM_NAMES = ("stdout", "stderr")
+
+
+class OutputProxy(object):
+    """Stands in for a global stream while a spinner runs. Complete lines
+    written to it are queued to be printed above the spinner on its next
+    tick, so they do not fight the render thread over the spinner line.
+    Text after the last newline is held back until its line is complete.
+
+    Parameters
+    ----------
+    spinner : Halo
+        Spinner the lines are printed above
+    stream : io
+        Stream the proxy stands in for
+    """
+
+    def __init__(self, spinner, stream):
+        self._spinner = spinner
+        self._stream = stream
+        self._partial = ""
+        self._lock = threading.Lock()
+        self._active = True
+
+    def write(self, s):
+        """Queue the complete lines of the text.
+        Parameters
+        ----------
+        s : str
+            Text to be written
+        Returns
+        -------
+        int
+            Number of characters written
+        """
+        if not self._active:
+            return self._stream.write(s)
+
+        with self._lock:
+            lines, newline, partial = (self._partial + s).rpartition("\n")
+            self._partial = partial
+
+        if newline:
+            self._spinner._queue_above(lines + newline, self._stream)
+
+        return len(s)
+
+    def flush(self):
+        """Lines are written by the spinner, which flushes them"""
+
+    def close(self):
+        """Stop queueing lines and hand over the text held back, if any.
+        Writes made afterwards, e.g. through references kept to the proxy,
+        go straight to the stream.
+        """
+        with self._lock:
+            self._active = False
+            partial, self._partial = self._partial, ""
+
+        if partial:
+            self._spinner._queue_above(partial, self._stream)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def intercept(spinner):
+    """Replace `sys.stdout` and `sys.stderr` with proxies queueing their
+    lines above the spinner.
+    Parameters
+    ----------
+    spinner : Halo
+        Spinner the lines are printed above
+    Returns
+    -------
+    list
+        Installed proxies
+    """
+    proxies = []
+    for name in STREAM_NAMES:
+        proxy = OutputProxy(spinner, getattr(sys, name))
+        setattr(sys, name, proxy)
+        proxies.append(proxy)
+    return proxies
+
+
+def restore(proxies):
+    """Put the streams replaced by `intercept` back, unless they were replaced
+    again meanwhile, and close the proxies.
+    Parameters
+    ----------
+    proxies : list
+        Proxies returned by `intercept`
+    """
+    for name, proxy in zip(STREAM_NAMES, proxies):
+        if getattr(sys, name) is proxy:
+            setattr(sys, name, proxy._stream)
+        proxy.close()
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""Progress counting for spinners.
+"""
+from threading import get_ident
+
+
+class Progress(object):
+    """Counts completed work and derives its rate and ETA.
+
+    `update` is called by producers and only adds to a counter owned by the
+    calling thread, so it needs neither a lock nor any formatting. Rates,
+    ETA and the summary are computed by the render thread in `summary`.
+    Parameters
+    ----------
+    total : int, optional
+        Amount of work to be done, if known
+    """
+
+    # Weight of the newest sample in the moving average of the rate
+    SMOOTHING = 0.3
+    # Seconds over which a rate sample is measured
+    SAMPLE_INTERVAL = 0.5
+
+    def __init__(self, total=None):
+        self.total = total
+        self.active = total is not None
+        self._counters = {}
+        self._rate = None
+        self._sample_time = None
+        self._sample_done = 0
+
+    def update(self, n=1):
+        """Add to the count of completed work.
+        Parameters
+        ----------
+        n : int, optional
+            Amount of work completed
+        """
+        try:
+            self._counters[get_ident()][0] += n
+        except KeyError:
+            self._counters[get_ident()] = [n]
+            self.active = True
+
+    def counter(self):
+        """Add a counter of its own for a producer to increment directly, e.g.
+        `counter[0] += 1` once per item of a hot loop, which is cheaper than
+        calling `update`. The counter is read along with the others.
+        Returns
+        -------
+        list
+            Counter, its count being the only item
+        """
+        counter = [0]
+        self._counters[("counter", id(counter))] = counter
+        self.active = True
+        return counter
+
+    @property
+    def done(self):
+        """Amount of completed work, summed over every producer thread
+        Returns
+        -------
+        int
+            Completed work
+        """
+        return sum(counter[0] for counter in list(self._counters.values()))
+
+    @property
+    def rate(self):
+        """Exponentially weighted moving average of the work completed per second
+        Returns
+        -------
+        float
+            Rate, `None` until it was measured once
+        """
+        return self._rate
+
+    def summary(self, now):
+        """Sample the rate and summarize the progress.
+        Parameters
+        ----------
+        now : float
+            Current monotonic time
+        Returns
+        -------
+        str
+            Completed work, percentage, rate and ETA as far as they are known
+        """
+        done = self.done
+
+        if self._sample_time is None:
+            self._sample_time = now
+            self._sample_done = done
+        elif now - self._sample_time >= self.SAMPLE_INTERVAL:
+            rate = (done - self._sample_done) / (now - self._sample_time)
+            if self._rate is None:
+                self._rate = rate
+            else:
+                self._rate += self.SMOOTHING * (rate - self._rate)
+            self._sample_time = now
+            self._sample_done = done
+
+        total = self.total
+        if total:
+            parts = ["{0}/{1}".format(done, total), "{0}%".format(100 * done // total)]
+        else:
+            parts = [str(done)]
+
+        if self._rate is not None:
+            parts.append("{0}/s".format(format_rate(self._rate)))
+            if total and self._rate > 0 and done < total:
+                parts.append("ETA {0}".format(format_duration((total - done) / self._rate)))
+
+        return " ".join(parts)
+
+
+def format_rate(rate):
+    """Format a rate with a precision fitting its magnitude.
+    Parameters
+    ----------
+    rate : float
+        Work per second
+    Returns
+    -------
+    str
+        Formatted rate
+    """
+    if rate < 10:
+        return "{0:.1f}".format(rate)
+
+    return "{0:.0f}".format(rate)
+
+
+def format_duration(seconds):
+    """Format a duration as `M:SS` or `H:MM:SS`.
+    Parameters
+    ----------
+    seconds : float
+        Duration
+    Returns
+    -------
+    str
+        Formatted duration
+    """
+    minutes, seconds = divmod(int(seconds + 0.5), 60)
+    hours, minutes = divmod(minutes, 60)
+
+    if hours:
+        return "{0}:{1:02d}:{2:02d}".format(hours, minutes, seconds)
+
+    return "{0}:{1:02d}".format(minutes, seconds)
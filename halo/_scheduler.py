@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""Process-wide render scheduler shared by every running spinner.
+"""
+import heapq
+import itertools
+import os
+import threading
+import time
+
+
+def next_deadline(deadline, interval, now):
+    """Computes the deadline of the frame following the one due at `deadline`.
+    Frames stay on a fixed cadence and frames which are already late are
+    dropped instead of being rendered in a burst.
+    Parameters
+    ----------
+    deadline : float
+        Monotonic time the previous frame was due at
+    interval : float
+        Seconds between two frames
+    now : float
+        Current monotonic time
+    Returns
+    -------
+    float
+        Monotonic time the next frame is due at
+    """
+    deadline += interval
+    if deadline <= now:
+        deadline += ((now - deadline) // interval + 1) * interval
+    return deadline
+
+
+class _Entry(object):
+    """Registration of a single spinner with the scheduler."""
+
+    __slots__ = ("spinner", "interval", "deadline", "active")
+
+    def __init__(self, spinner, interval, deadline):
+        self.spinner = spinner
+        self.interval = interval
+        self.deadline = deadline
+        self.active = True
+
+
+class RenderScheduler(object):
+    """Drives every registered spinner from a single daemon thread.
+
+    Registered spinners are kept in a heap ordered by the deadline of their
+    next frame, so N spinners cost one thread and spinners which are due at
+    the same time are rendered on the same wakeup. The thread waits on a
+    condition, so unregistering a spinner never waits for a frame interval.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        """Forgets every registration, e.g. in a freshly forked child."""
+        self._condition = threading.Condition(threading.RLock())
+        self._heap = []
+        self._entries = {}
+        self._ids = itertools.count(1)
+        self._thread = None
+
+    def register(self, spinner, interval):
+        """Registers a spinner to have its frames rendered periodically.
+        Parameters
+        ----------
+        spinner : Halo
+            Spinner whose `_render_frame` is called on every tick
+        interval : float
+            Seconds between two frames of the spinner
+        Returns
+        -------
+        str
+            Id of the registration
+        """
+        with self._condition:
+            if spinner not in self._entries:
+                entry = _Entry(spinner, interval, time.monotonic() + interval)
+                self._entries[spinner] = entry
+                self._push(entry)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="halo-scheduler"
+                )
+                self._thread.daemon = True
+                self._thread.start()
+
+            self._condition.notify()
+            return "spinner-{0}".format(next(self._ids))
+
+    def unregister(self, spinner):
+        """Stops rendering the given spinner. Once this returns, no frame of
+        the spinner is being rendered or will be rendered by the scheduler.
+        Parameters
+        ----------
+        spinner : Halo
+            Previously registered spinner
+        """
+        with self._condition:
+            entry = self._entries.pop(spinner, None)
+            if entry is not None:
+                # The entry stays in the heap until its deadline, but must
+                # not keep the spinner alive until then
+                entry.active = False
+                entry.spinner = None
+                self._condition.notify()
+
+    def _push(self, entry):
+        heapq.heappush(self._heap, (entry.deadline, id(entry), entry))
+
+    def _run(self):
+        """Renders due spinners until none is registered anymore."""
+        with self._condition:
+            while self._entries:
+                deadline, _, entry = self._heap[0]
+
+                if not entry.active:
+                    heapq.heappop(self._heap)
+                    continue
+
+                now = time.monotonic()
+                if deadline > now:
+                    self._condition.wait(deadline - now)
+                    continue
+
+                heapq.heappop(self._heap)
+                try:
+                    entry.spinner._render_frame()
+                except Exception:  # pylint: disable=broad-except
+                    # A broken spinner must not take down every other one.
+                    import traceback
+
+                    traceback.print_exc()
+                    self._entries.pop(entry.spinner, None)
+                    continue
+
+                entry.deadline = next_deadline(
+                    deadline, entry.interval, time.monotonic()
+                )
+                self._push(entry)
+
+            del self._heap[:]
+            self._thread = None
+
+
+scheduler = RenderScheduler()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=scheduler._reset)
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""Spinners counting the items of an iterable.
+"""
+from __future__ import absolute_import, unicode_literals
+
+
+def track(iterable, text="", total=None, **kwargs):
+    """Yields the items of an iterable while a spinner shows how many were done.
+    The spinner is started with the first item, succeeds once the iterable
+    is exhausted, fails if the iterable raises and is stopped if the loop
+    ends early. Async iterables are tracked by an `AsyncHalo` and iterated
+    with `async for`.
+
+    An exception raised by the body of the loop ends it early as well, as a
+    generator is only closed and can not tell it from a `break`. To fail the
+    spinner in that case, use the result as a context manager::
+
+        with track(files) as items:
+            for f in items:
+                process(f)
+
+    Every item adds to a counter the render thread reads, so the overhead
+    per item is a counter increment and the count shown is never stale.
+    Parameters
+    ----------
+    iterable : iterable|async iterable
+        Items to be yielded
+    text : str|callable, optional
+        Text to display
+    total : int, optional
+        Number of items, defaults to the length of the iterable if it has one
+    **kwargs
+        Further arguments of the spinner
+    Returns
+    -------
+    Tracked
+        Iterable, and context manager, yielding the items
+    """
+    if total is None:
+        try:
+            total = len(iterable)
+        except TypeError:
+            pass
+
+    if hasattr(iterable, "__aiter__"):
+        from halo.async_halo import AsyncHalo
+
+        return Tracked(AsyncHalo(text=text, total=total, **kwargs), iterable)
+
+    from halo.halo import Halo
+
+    return Tracked(Halo(text=text, total=total, **kwargs), iterable)
+
+
+class Tracked(object):
+    """Items of an iterable counted by a spinner, as returned by `track`.
+    Iterating it yields the items. Used as a context manager, it also fails
+    the spinner if the block raises, e.g. from the body of the loop.
+
+    Parameters
+    ----------
+    spinner : Halo
+        Spinner counting the items
+    iterable : iterable|async iterable
+        Items to be yielded
+    """
+
+    def __init__(self, spinner, iterable):
+        self.spinner = spinner
+        self._iterable = iterable
+        self._entered = False
+        self._finished = False
+
+    def __iter__(self):
+        return self._items()
+
+    def __aiter__(self):
+        return self._async_items()
+
+    def __enter__(self):
+        self._entered = True
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self._exit(value)
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, type, value, traceback):
+        self._exit(value)
+
+    def _exit(self, error):
+        """Fails the spinner if the block raised, or stops it if the loop
+        ended early, unless the iteration already finished the spinner.
+        Parameters
+        ----------
+        error : BaseException
+            Exception raised by the block, if any
+        """
+        self._entered = False
+        self._finish(self.spinner.stop if error is None else self.spinner.fail)
+
+    def _finish(self, outcome):
+        """Finishes the spinner once.
+        Parameters
+        ----------
+        outcome : callable
+            `succeed`, `fail` or `stop` of the spinner
+        """
+        if not self._finished:
+            self._finished = True
+            outcome()
+
+    def _close(self):
+        """Stops the spinner once the loop ended early, unless the block
+        around it decides how the spinner finishes.
+        """
+        if not self._entered:
+            self._finish(self.spinner.stop)
+
+    def _items(self):
+        """Yields the items of the iterable while the spinner counts them."""
+        counter = self.spinner._progress.counter()
+
+        self.spinner.start()
+        try:
+            for item in self._iterable:
+                yield item
+                counter[0] += 1
+        except GeneratorExit:
+            self._close()
+            raise
+        except BaseException:
+            self._finish(self.spinner.fail)
+            raise
+
+        self._finish(self.spinner.succeed)
+
+    async def _async_items(self):
+        """Yields the items of the async iterable while the spinner counts them."""
+        import asyncio
+
+        counter = self.spinner._progress.counter()
+
+        self.spinner.start()
+        try:
+            async for item in self._iterable:
+                yield item
+                counter[0] += 1
+        except (GeneratorExit, asyncio.CancelledError):
+            self._close()
+            raise
+        except BaseException:
+            self._finish(self.spinner.fail)
+            raise
+
+        self._finish(self.spinner.succeed)
@@ -2,16 +2,23 @@
 """Utilities for Halo library.
 """
 import codecs
-import platform
-import six
+import functools
+import os
+import time
 
-from colorama import init
-from shutil import get_terminal_size
-from termcolor import colored
+# Upper bound of distinct (frames, color, attrs) tables kept by colored_frames
+COLORED_FRAMES_CACHE_SIZE = 128
 
-init(autoreset=True)
+# Main symbol, fallback symbol and color of the symbols persisted by a spinner
+LOG_SYMBOLS = {
+    'info': ('ℹ', '¡', 'blue'),
+    'success': ('✔', 'v', 'green'),
+    'warning': ('⚠', '!!', 'yellow'),
+    'error': ('✖', '×', 'red'),
+}
 
 
+@functools.lru_cache(maxsize=None)
 def is_supported():
     """Check whether operating system supports main symbols or not.
 
@@ -21,6 +28,8 @@ def is_supported():
         Whether operating system supports main symbols or not
     """
 
+    import platform
+
     os_arch = platform.system()
 
     if os_arch != 'Windows':
@@ -29,6 +38,18 @@ def is_supported():
     return False
 
 
+def is_disabled_by_environment():
+    """Check whether spinners are disabled by the `HALO_DISABLE` environment
+    variable, which is set to anything but an empty string or `0`.
+
+    Returns
+    -------
+    boolean
+        Whether spinners are disabled
+    """
+    return os.environ.get('HALO_DISABLE', '') not in ('', '0')
+
+
 def get_environment():
     """Get the environment in which halo is running
 
@@ -71,7 +92,90 @@ def colored_frame(frame, color):
     str
         Colored frame
     """
-    return colored(frame, color, attrs=['bold'])
+    return _get_colored()(frame, color, attrs=['bold'])
+
+
+@functools.lru_cache(maxsize=COLORED_FRAMES_CACHE_SIZE)
+def colored_frames(frames, color, attrs=('bold',)):
+    """Color all frames with given color and attributes. Results are kept
+    in a bounded LRU cache shared by every spinner.
+
+    Parameters
+    ----------
+    frames : tuple
+        Frames to be colored
+    color : str
+        Color to be applied
+    attrs : tuple, optional
+        Attributes to be applied
+
+    Returns
+    -------
+    tuple
+        Colored frames
+    """
+    colored = _get_colored()
+    return tuple(colored(frame, color, attrs=list(attrs)) for frame in frames)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_colored():
+    """Load the color backend on first use, as it is costly to import.
+
+    Returns
+    -------
+    callable
+        termcolor's colored function
+    """
+    from termcolor import colored
+
+    return colored
+
+
+@functools.lru_cache(maxsize=None)
+def get_log_symbol(name):
+    """Get the colored log symbol supported by the operating system.
+
+    Parameters
+    ----------
+    name : str
+        One of `info`, `success`, `warning` or `error`
+
+    Returns
+    -------
+    str
+        Colored symbol
+    """
+    main, fallback, color = LOG_SYMBOLS[name]
+    symbol = main if is_supported() else fallback
+    return colored_frames((symbol,), color, attrs=())[0]
+
+
+def get_ansi_stream(stream):
+    """Get a stream ANSI codes can be written to. Only on Windows consoles
+    which do not understand ANSI codes is the stream wrapped, to translate
+    them into win32 calls. Global streams are never replaced.
+
+    Parameters
+    ----------
+    stream : io
+        Stream to be written to
+
+    Returns
+    -------
+    io
+        Stream to write to
+    """
+    if os.name != 'nt':
+        return stream
+
+    from colorama import AnsiToWin32
+
+    wrapper = AnsiToWin32(stream)
+    if wrapper.should_wrap():
+        return wrapper.stream
+
+    return stream
 
 
 def is_text_type(text):
@@ -87,10 +191,7 @@ def is_text_type(text):
     bool
         Whether parameter is a string or not
     """
-    if isinstance(text, six.text_type) or isinstance(text, six.string_types):
-        return True
-
-    return False
+    return isinstance(text, str)
 
 
 def decode_utf_8_text(text):
@@ -131,6 +232,113 @@ def encode_utf_8_text(text):
         return text
 
 
+class TerminalColumns(object):
+    """Cache of the amount of columns and lines in the terminal.
+
+    Where SIGWINCH is available, a handler invalidating the cache is
+    installed on the first query, chaining any handler installed before.
+    The cache then only expires every `watch_interval` seconds, in case a
+    handler installed later replaced it, after which it expires every
+    `poll_interval` seconds, as it does where SIGWINCH can not be watched.
+
+    Parameters
+    ----------
+    poll_interval : float
+        Seconds after which the cache expires if SIGWINCH is not watched
+    watch_interval : float
+        Seconds after which the cache expires while SIGWINCH is watched
+    """
+
+    def __init__(self, poll_interval=1.0, watch_interval=30.0):
+        self.poll_interval = poll_interval
+        self.watch_interval = watch_interval
+        self._columns = 80
+        self._lines = 24
+        self._expires = 0
+        # None until the handler is installed, False once it was replaced
+        self._watching = None
+        self._previous_handler = None
+
+    def get(self):
+        """Get the amount of columns, refreshed if the cache is stale
+
+        Returns
+        -------
+        int
+            Terminal width
+        """
+        if time.monotonic() >= self._expires:
+            self._refresh()
+
+        return self._columns
+
+    def get_lines(self):
+        """Get the amount of lines, refreshed if the cache is stale
+
+        Returns
+        -------
+        int
+            Terminal height
+        """
+        if time.monotonic() >= self._expires:
+            self._refresh()
+
+        return self._lines
+
+    def _refresh(self):
+        """Query the terminal size and decide when to query it again"""
+        from shutil import get_terminal_size
+
+        if self._watch_resizes():
+            # Reset first, so a resize while querying is not missed
+            self._expires = time.monotonic() + self.watch_interval
+        else:
+            self._expires = time.monotonic() + self.poll_interval
+
+        columns, lines = get_terminal_size()
+
+        # If column size is 0 either we are not connected
+        # to a terminal or something else went wrong. Fallback to 80.
+        self._columns = columns if columns != 0 else 80
+        self._lines = lines if lines != 0 else 24
+
+    def _on_resize(self, signum, frame):
+        """SIGWINCH handler invalidating the cache"""
+        self._expires = 0
+
+        if callable(self._previous_handler):
+            self._previous_handler(signum, frame)
+
+    def _watch_resizes(self):
+        """Install the SIGWINCH handler, chaining any previous handler
+
+        Returns
+        -------
+        bool
+            Whether resizes invalidate the cache
+        """
+        import signal
+
+        if self._watching is not None:
+            if self._watching and signal.getsignal(signal.SIGWINCH) != self._on_resize:
+                # Replaced since, e.g. by curses, which is left in place
+                self._watching = False
+            return self._watching
+
+        try:
+            self._previous_handler = signal.getsignal(signal.SIGWINCH)
+            signal.signal(signal.SIGWINCH, self._on_resize)
+        except (AttributeError, ValueError):
+            # No SIGWINCH on this platform or not called from the main thread
+            return False
+
+        self._watching = True
+        return True
+
+
+terminal_columns = TerminalColumns()
+
+
 def get_terminal_columns():
     """Determine the amount of available columns in the terminal
 
@@ -139,11 +347,15 @@ def get_terminal_columns():
     int
         Terminal width
     """
-    terminal_size = get_terminal_size()
-
-    # If column size is 0 either we are not connected
-    # to a terminal or something else went wrong. Fallback to 80.
-    if terminal_size.columns == 0:
-        return 80
-    else:
-        return terminal_size.columns
+    return terminal_columns.get()
+
+
+def get_terminal_lines():
+    """Determine the amount of available lines in the terminal
+
+    Returns
+    -------
+    int
+        Terminal height
+    """
+    return terminal_columns.get_lines()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Halo spinners driven by the asyncio event loop.
+"""
+from __future__ import absolute_import, unicode_literals
+
+import asyncio
+import functools
+import itertools
+
+from halo._scheduler import next_deadline
+from halo.halo import Halo
+
+_ids = itertools.count(1)
+
+
+class AsyncHalo(Halo):
+    """Halo rendering its frames from timer callbacks on the running asyncio
+    event loop, so a spinner costs one timer handle and no thread. Frames are
+    scheduled on a fixed cadence of loop deadlines.
+
+    The spinner has to be started and stopped from the event loop thread.
+    """
+
+    _loop = None
+    _handle = None
+    _deadline = None
+
+    async def __aenter__(self):
+        """Starts the spinner on the running event loop. For use in async context managers.
+        Returns
+        -------
+        self
+        """
+        return self.start()
+
+    async def __aexit__(self, type, value, traceback):
+        """Stops the spinner. For use in async context managers."""
+        self.stop()
+
+    def __call__(self, f):
+        """Allow the AsyncHalo object to be used as a decorator of coroutine functions.
+        Plain functions would block the event loop the spinner is animated by,
+        they are decorated with `Halo` instead.
+        Raises
+        ------
+        TypeError
+            If the function is no coroutine function
+        """
+        if not asyncio.iscoroutinefunction(f):
+            raise TypeError(
+                "AsyncHalo decorates coroutine functions, use Halo to decorate {0!r}".format(f)
+            )
+
+        @functools.wraps(f)
+        async def wrapped(*args, **kwargs):
+            async with self:
+                return await f(*args, **kwargs)
+
+        return wrapped
+
+    def start(self, text=None):
+        """Starts the spinner on the running event loop.
+        Parameters
+        ----------
+        text : None, optional
+            Text to be used alongside spinner
+        Returns
+        -------
+        self
+        Raises
+        ------
+        RuntimeError
+            If the spinner is enabled and there is no running event loop
+        """
+        if self.enabled:
+            self._loop = asyncio.get_running_loop()
+        return super(AsyncHalo, self).start(text)
+
+    def _schedule(self):
+        """Schedules the next frame on the running event loop.
+        Returns
+        -------
+        str
+            Spinner id
+        """
+        self._deadline = self._loop.time() + 0.001 * self._interval
+        self._handle = self._loop.call_at(self._deadline, self._tick)
+        return "async-spinner-{0}".format(next(_ids))
+
+    def _unschedule(self):
+        """Cancels the next frame scheduled on the event loop.
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _tick(self):
+        """Renders a frame and schedules the next one.
+        """
+        self._render_frame()
+        self._deadline = next_deadline(
+            self._deadline, 0.001 * self._interval, self._loop.time()
+        )
+        self._handle = self._loop.call_at(self._deadline, self._tick)
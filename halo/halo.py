@@ -4,25 +4,31 @@
 """
 from __future__ import absolute_import, unicode_literals
 
-import atexit
+import contextlib
 import functools
 import sys
 import threading
 import time
 
+from collections import deque
+from collections.abc import Mapping
+
 import halo.cursor as cursor
 
-from log_symbols.symbols import LogSymbols
-from spinners.spinners import Spinners
+from halo._cleanup import track_running, untrack_running
+from halo._coordinator import coordinator_for
+from halo._progress import Progress
+from halo._scheduler import scheduler
 
 from halo._utils import (
     colored_frame,
+    colored_frames,
     decode_utf_8_text,
-    get_environment,
+    get_log_symbol,
     get_terminal_columns,
+    is_disabled_by_environment,
     is_supported,
     is_text_type,
-    encode_utf_8_text,
 )
 
 
@@ -39,6 +45,20 @@ class Halo(object):
         "left",
         "right",
     )
+    FLUSH_POLICIES = (
+        "always",
+        "never",
+    )
+    MODES = (
+        "auto",
+        "line",
+        "diff",
+        "log",
+    )
+
+    # Held while the spinner is marked stopped and its line cleared, created
+    # on the first start. See HaloLoggingHandler.
+    _stop_lock = None
 
     def __init__(
         self,
@@ -51,12 +71,19 @@ class Halo(object):
         interval=-1,
         enabled=True,
         stream=sys.stdout,
+        flush_policy="always",
+        mode="auto",
+        heartbeat=30000,
+        text_fields=None,
+        total=None,
+        intercept_output=False,
     ):
         """Constructs the Halo object.
         Parameters
         ----------
-        text : str, optional
-            Text to display.
+        text : str|callable, optional
+            Text to display. A callable is called whenever a frame is rendered
+            and returns the text.
         text_color : str, optional
             Color of the text.
         color : str, optional
@@ -73,46 +100,110 @@ class Halo(object):
         interval : integer, optional
             Interval between each frame of the spinner in milliseconds.
         enabled : boolean, optional
-            Spinner enabled or not.
+            Spinner enabled or not. Spinners are also disabled when the `HALO_DISABLE`
+            environment variable is set. Disabled spinners only resolve their
+            spinner once it is needed, so they cost next to nothing.
         stream : io, optional
             Output.
+        flush_policy : str|integer, optional
+            When to flush the stream after a frame is written. Can be `always`, `never`
+            or the minimum number of milliseconds between two flushes.
+            Defaults to `always`.
+        mode : str, optional
+            How frames are drawn. `line` rewrites the whole line on every frame,
+            `diff` only rewrites the cells which changed since the previous frame,
+            `log` prints a plain status line whenever the text changes and every
+            `heartbeat` milliseconds. `auto` picks `line` for terminals and `log`
+            otherwise. Defaults to `auto`.
+        heartbeat : integer, optional
+            Milliseconds after which an unchanged status line is printed again in
+            `log` mode.
+        text_fields : dict|object, optional
+            Makes the text a format template, whose fields are looked up in this
+            mapping or object whenever a frame is rendered.
+        total : integer, optional
+            Amount of work to be done. Shows the progress counted with `update`,
+            its percentage, rate and ETA next to the spinner.
+        intercept_output : boolean, optional
+            Replace `sys.stdout` and `sys.stderr` while the spinner runs, so what is
+            printed meanwhile is printed above the spinner on its next frame instead
+            of garbling the spinner line.
         """
         self._color = color
         self._animation = animation
+        self._text_color = text_color
+        self._text = None
+        self._text_fields = text_fields
+        self._progress = Progress(total)
+        self._progress_width = 0
 
-        self.spinner = spinner
         self.text = text
-        self._text_color = text_color
 
-        self._interval = (
-            int(interval) if int(interval) > 0 else self._spinner["interval"]
-        )
+        if enabled and not is_disabled_by_environment():
+            self.spinner = spinner
+            self._interval = (
+                int(interval) if int(interval) > 0 else self._spinner["interval"]
+            )
+        else:
+            # Nothing is drawn, resolving the spinner is left to __getattr__
+            enabled = False
+            self._deferred_spinner = (spinner, interval)
+
+        # Writes go through the coordinator of the stream, see __getattr__
         self._stream = stream
 
         self.placement = placement
+        self.flush_policy = flush_policy
+        self._next_flush = 0
+        # Whether the flush policy left a write unflushed
+        self._unflushed = False
+        self._last_frame = None
+        self._last_cells = None
+        self._skipped_writes = 0
+        self._above = deque()
+        self._intercept_output = intercept_output
+        self._proxies = None
+        self._heartbeat = heartbeat
+        self._next_heartbeat = 0
+        self.mode = mode
         self._frame_index = 0
         self._text_index = 0
-        self._spinner_thread = None
         self._stop_spinner = None
         self._spinner_id = None
         self.enabled = enabled
 
-        environment = get_environment()
+    def __getattr__(self, name):
+        """Resolves the spinner of a spinner constructed disabled the first
+        time one of its frames, its interval or its value is needed, and the
+        coordinator shared with every spinner writing to the stream the first
+        time the spinner writes.
+        """
+        if name == "_coordinator":
+            self._coordinator = coordinator_for(self._stream)
+            return self._coordinator
+
+        deferred = self.__dict__.get("_deferred_spinner")
+        if deferred is None or name not in ("_spinner", "_frames", "_interval"):
+            raise AttributeError(
+                "'{0}' object has no attribute '{1}'".format(
+                    type(self).__name__, name
+                )
+            )
 
-        def clean_up(args):
-            """Handle cell execution"""
-            self.stop()
+        self._deferred_spinner = None
+        spinner, interval = deferred
 
-        if environment in ("ipython", "jupyter"):
-            from IPython import get_ipython
+        if "_spinner" not in self.__dict__:
+            # The spinner may have been replaced meanwhile
+            self.spinner = spinner
+        self._interval = (
+            int(interval) if int(interval) > 0 else self._spinner["interval"]
+        )
 
-            ip = get_ipython()
-            ip.events.register("post_run_cell", clean_up)
-        else:  # default terminal
-            atexit.register(clean_up)
+        return getattr(self, name)
 
     def __enter__(self):
-        """Starts the spinner on a separate thread. For use in context managers.
+        """Starts the spinner on the shared render thread. For use in context managers.
         Returns
         -------
         self
@@ -153,8 +244,10 @@ class Halo(object):
         """
 
         self._spinner = self._get_spinner(spinner)
+        self._frames = self._get_colored_frames()
         self._frame_index = 0
         self._text_index = 0
+        self._text_dirty = True
 
     @property
     def text(self):
@@ -164,17 +257,73 @@ class Halo(object):
         str
             text value
         """
-        return self._text["original"]
+        return self._text_value
 
     @text.setter
     def text(self, text):
-        """Setter for text property.
+        """Setter for text property. The text is only laid out when the next
+        frame is rendered, so it can be updated cheaply from hot loops.
         Parameters
         ----------
-        text : str
+        text : str|callable
             Defines the text value for spinner
         """
-        self._text = self._get_text(text)
+        self._text_value = text
+        self._text_dirty = True
+
+    @property
+    def text_fields(self):
+        """Getter for text fields property.
+        Returns
+        -------
+        dict|object
+            fields of the text template
+        """
+        return self._text_fields
+
+    @text_fields.setter
+    def text_fields(self, text_fields):
+        """Setter for text fields property.
+        Parameters
+        ----------
+        text_fields : dict|object
+            Defines where the fields of the text template are looked up,
+            `None` to use the text as is
+        """
+        self._text_fields = text_fields
+        self._text_dirty = True
+
+    @property
+    def total(self):
+        """Getter for total property.
+        Returns
+        -------
+        int
+            amount of work to be done
+        """
+        return self._progress.total
+
+    @total.setter
+    def total(self, total):
+        """Setter for total property.
+        Parameters
+        ----------
+        total : int
+            Defines the amount of work to be done, `None` if unknown
+        """
+        self._progress.total = total
+        if total is not None:
+            self._progress.active = True
+
+    @property
+    def done(self):
+        """Getter for the amount of work counted with `update`
+        Returns
+        -------
+        int
+            amount of completed work
+        """
+        return self._progress.done
 
     @property
     def text_color(self):
@@ -195,6 +344,7 @@ class Halo(object):
             Defines the text color value for spinner
         """
         self._text_color = text_color
+        self._text_dirty = True
 
     @property
     def color(self):
@@ -215,6 +365,7 @@ class Halo(object):
             Defines the color value for spinner
         """
         self._color = color
+        self._frames = self._get_colored_frames()
 
     @property
     def placement(self):
@@ -242,6 +393,63 @@ class Halo(object):
             )
         self._placement = placement
 
+    @property
+    def flush_policy(self):
+        """Getter for flush policy property.
+        Returns
+        -------
+        str|integer
+            flush policy
+        """
+        return self._flush_policy
+
+    @flush_policy.setter
+    def flush_policy(self, flush_policy):
+        """Setter for flush policy property.
+        Parameters
+        ----------
+        flush_policy: str|integer
+            Defines when the stream is flushed after writing a frame
+        """
+        if flush_policy not in self.FLUSH_POLICIES and not (
+            isinstance(flush_policy, (int, float))
+            and not isinstance(flush_policy, bool)
+            and flush_policy >= 0
+        ):
+            raise ValueError(
+                "Unknown flush policy '{0}', available are {1} or milliseconds".format(
+                    flush_policy, self.FLUSH_POLICIES
+                )
+            )
+        self._flush_policy = flush_policy
+
+    @property
+    def mode(self):
+        """Getter for mode property.
+        Returns
+        -------
+        str
+            render mode
+        """
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode):
+        """Setter for mode property.
+        Parameters
+        ----------
+        mode: str
+            Defines how frames are drawn on the line
+        """
+        if mode not in self.MODES:
+            raise ValueError(
+                "Unknown mode '{0}', available are {1}".format(mode, self.MODES)
+            )
+        self._mode = mode
+        self._render_mode = None
+        self._last_frame = None
+        self._last_cells = None
+
     @property
     def spinner_id(self):
         """Getter for spinner id
@@ -252,6 +460,17 @@ class Halo(object):
         """
         return self._spinner_id
 
+    @property
+    def skipped_writes(self):
+        """Getter for the number of frames which were not written because
+        they were identical to the frame already on the line
+        Returns
+        -------
+        int
+            Number of skipped writes
+        """
+        return self._skipped_writes
+
     @property
     def animation(self):
         """Getter for animation property.
@@ -271,7 +490,7 @@ class Halo(object):
             Defines the animation of the spinner
         """
         self._animation = animation
-        self._text = self._get_text(self._text["original"])
+        self._text_dirty = True
 
     def _check_stream(self):
         """Returns whether the stream is open, and if applicable, writable
@@ -294,27 +513,87 @@ class Halo(object):
 
         return True
 
-    def _write(self, s):
-        """Write to the stream, if writable
+    def _write(self, s, flush=False):
+        """Write to the stream, if writable, with a single call and flush it
+        according to the flush policy. Writes go through the coordinator of
+        the stream, so they are never interleaved with those of other
+        spinners or threads.
         Parameters
         ----------
         s : str
             Characters to write to the stream
+        flush : bool, optional
+            Flush the stream regardless of the flush policy
         """
         if self._check_stream():
-            self._stream.write(s)
+            flush = self._flush_due(force=flush)
+            self._unflushed = not flush
+            self._coordinator.write(s, flush=flush)
+
+    def _flush_owed(self):
+        """Flush the stream if a write was left unflushed and the flush policy
+        now allows it, so a frame is not held back by the unchanged ones after it
+        """
+        if self._unflushed and self._check_stream() and self._flush_due():
+            self._unflushed = False
+            self._coordinator.flush()
+
+    def _flush_due(self, force=False):
+        """Returns whether the flush policy allows flushing the stream
+        Parameters
+        ----------
+        force : bool, optional
+            Flush the stream regardless of the flush policy
+        Returns
+        -------
+        bool
+            Whether to flush the stream
+        """
+        policy = self._flush_policy
+
+        if not force and policy != "always":
+            if policy == "never":
+                return False
+
+            now = time.monotonic()
+            if now < self._next_flush:
+                return False
+            self._next_flush = now + 0.001 * policy
+
+        return True
+
+    def _get_render_mode(self):
+        """Resolves the `auto` mode to `line` for terminals and `log` otherwise
+        Returns
+        -------
+        str
+            Mode frames are drawn with
+        """
+        if self._render_mode is None:
+            mode = self._mode
+            if mode == "auto":
+                try:
+                    mode = "line" if self._stream.isatty() else "log"
+                except (AttributeError, ValueError):
+                    # closed or exotic streams, nothing gets written anyway
+                    mode = "line"
+            self._render_mode = mode
+
+        return self._render_mode
 
     def _hide_cursor(self):
         """Disable the user's blinking cursor
         """
         if self._check_stream() and self._stream.isatty():
-            cursor.hide(stream=self._stream)
+            with self._coordinator.exclusive() as stream:
+                cursor.hide(stream=stream)
 
     def _show_cursor(self):
         """Re-enable the user's blinking cursor
         """
         if self._check_stream() and self._stream.isatty():
-            cursor.show(stream=self._stream)
+            with self._coordinator.exclusive() as stream:
+                cursor.show(stream=stream)
 
     def _get_spinner(self, spinner):
         """Extracts spinner value from options and returns value
@@ -328,6 +607,9 @@ class Halo(object):
         dict
             Contains frames and interval defining spinner
         """
+        # Loading every spinner is costly, so only do it once one is needed
+        from spinners.spinners import Spinners
+
         default_spinner = Spinners["dots"].value
 
         if spinner and type(spinner) == dict:
@@ -355,33 +637,169 @@ class Halo(object):
 
         # Subtract to the current terminal size the max spinner length
         # (-1 to leave room for the extra space between spinner and text)
-        terminal_width = get_terminal_columns() - max_spinner_length - 1
+        # and the room taken by the progress summary
+        columns = get_terminal_columns()
+        terminal_width = columns - max_spinner_length - 1 - self._progress_width
         text_length = len(stripped_text)
 
-        frames = []
-
+        # Animation frames are sliced from the stripped text when rendered,
+        # so only their count is computed here
         if terminal_width < text_length and animation:
             if animation == "bounce":
-                """
-                Make the text bounce back and forth
-                """
-                for x in range(0, text_length - terminal_width + 1):
-                    frames.append(stripped_text[x : terminal_width + x])
-                frames.extend(list(reversed(frames)))
-            elif "marquee":
-                """
-                Make the text scroll like a marquee
-                """
-                stripped_text = stripped_text + " " + stripped_text[:terminal_width]
-                for x in range(0, text_length + 1):
-                    frames.append(stripped_text[x : terminal_width + x])
-        elif terminal_width < text_length and not animation:
+                # Make the text bounce back and forth
+                animation = "bounce"
+                frame_count = 2 * (text_length - terminal_width + 1)
+            else:
+                # Make the text scroll like a marquee
+                animation = "marquee"
+                frame_count = text_length + 1
+
+            return {
+                "original": text,
+                "stripped": stripped_text,
+                "columns": columns,
+                "reserved": self._progress_width,
+                "animation": animation,
+                "width": terminal_width,
+                "count": frame_count,
+                "frame": None,
+                "colored": None,
+            }
+
+        if terminal_width < text_length:
             # Add ellipsis if text is larger than terminal width and no animation was specified
-            frames = [stripped_text[: terminal_width - 6] + " (...)"]
+            frame = stripped_text[: terminal_width - 6] + " (...)"
         else:
-            frames = [stripped_text]
+            frame = stripped_text
+
+        return {
+            "original": text,
+            "stripped": stripped_text,
+            "columns": columns,
+            "reserved": self._progress_width,
+            "animation": None,
+            "width": terminal_width,
+            "count": 1,
+            "frame": frame,
+            "colored": self._get_colored_text_frame(frame),
+        }
+
+    def _layout_text(self):
+        """Lays the text out again if it changed or the terminal was resized
+        since it was last laid out.
+        Returns
+        -------
+        dict
+            Layout of the text
+        """
+        text = self._text
+        dirty = self._text_dirty
+
+        if dirty:
+            # Reset the flag before reading the text, so an update made
+            # meanwhile from another thread is laid out on the next frame
+            self._text_dirty = False
+
+        value = self._resolve_text()
+
+        if (
+            dirty
+            or value != text["original"]
+            or text["columns"] != get_terminal_columns()
+            or text["reserved"] != self._progress_width
+        ):
+            text = self._text = self._get_text(value)
+
+        return text
+
+    def _resolve_text(self):
+        """Evaluates the text if it is a callable or a template
+        Returns
+        -------
+        str
+            Text to display
+        """
+        text = self._text_value
+
+        if callable(text):
+            return text()
+
+        fields = self._text_fields
+        if fields is None:
+            return text
+
+        if not isinstance(fields, Mapping):
+            fields = vars(fields)
+
+        return text.format_map(fields)
+
+    def _progress_summary(self):
+        """Summarizes the progress counted with `update`. Called when a frame
+        is rendered, so the rate is sampled on the render thread.
+        Returns
+        -------
+        str
+            Progress summary, empty if no progress is tracked
+        """
+        if not self._progress.active:
+            return ""
 
-        return {"original": text, "frames": frames}
+        return self._progress.summary(time.monotonic())
+
+    def _get_text_frame(self, index):
+        """Slices the frame of the text animation at the given index
+        Parameters
+        ----------
+        index : int
+            Index of the frame, lower than the frame count of the text
+        Returns
+        -------
+        str
+            Text frame
+        """
+        stripped_text = self._text["stripped"]
+        width = self._text["width"]
+
+        if self._text["animation"] == "bounce":
+            # Offsets go from 0 up to the last one, then back down to 0
+            last_offset = len(stripped_text) - width
+            offset = index if index <= last_offset else 2 * last_offset + 1 - index
+            return stripped_text[offset : offset + width]
+
+        # The text scrolls by, followed by a space and its own beginning
+        if index + width <= len(stripped_text):
+            return stripped_text[index : index + width]
+
+        return (stripped_text[index:] + " " + stripped_text[:width])[:width]
+
+    def _get_colored_frames(self):
+        """Colors the spinner frames once, so rendering a tick does no formatting.
+        Returns
+        -------
+        tuple
+            Spinner frames wrapped in the spinner color
+        """
+        frames = tuple(self._spinner["frames"])
+        if self._color:
+            return colored_frames(frames, self._color)
+        return frames
+
+    def _get_colored_text_frame(self, frame):
+        """Colors a static text frame once per layout, so rendering a tick does
+        no formatting. Texts are not kept in the cache of `colored_frames`, as
+        every distinct text would push out the frames of the spinners.
+        Parameters
+        ----------
+        frame : str
+            Text frame to be colored
+        Returns
+        -------
+        str
+            Text frame wrapped in the text color
+        """
+        if self._text_color:
+            return colored_frame(frame, self._text_color)
+        return frame
 
     def clear(self):
         """Clears the line and returns cursor to the start.
@@ -390,12 +808,17 @@ class Halo(object):
         -------
         self
         """
-        self._write("\r")
-        self._write(self.CLEAR_LINE)
+        self._last_frame = None
+        self._last_cells = None
+        if self._get_render_mode() != "log":
+            self._write(self._flush_above("\r{0}".format(self.CLEAR_LINE)))
+        elif self._above:
+            self._write(self._flush_above(""))
         return self
 
     def _render_frame(self):
-        """Renders the frame on the line after clearing it.
+        """Renders the frame on the line after clearing it. Nothing is written
+        if the frame is identical to the one already on the line.
         """
         if not self.enabled:
             # in case we're disabled or stream is closed while still rendering,
@@ -403,41 +826,162 @@ class Halo(object):
             # frame is rendered if we're reenabled or the stream opens again.
             return
 
-        self.clear()
+        if self._get_render_mode() == "log":
+            self._render_status_line()
+            return
+
         frame = self.frame()
-        output = "\r{}".format(frame)
-        try:
-            self._write(output)
-        except UnicodeEncodeError:
-            self._write(encode_utf_8_text(output))
+        if self._above:
+            # The lines move the spinner down, so redraw the whole line below them
+            self._last_cells = None
+            output = self._flush_above("\r{0}".format(self.CLEAR_LINE)) + frame
+        elif frame == self._last_frame:
+            self._skipped_writes += 1
+            self._flush_owed()
+            return
+        elif self._render_mode == "diff":
+            output = self._diff_frame(frame)
+        else:
+            output = "\r{0}{1}".format(self.CLEAR_LINE, frame)
+
+        self._last_frame = frame
+        self._write(output)
+
+    def _render_status_line(self):
+        """Prints the text on its own line, without any escape codes, if it
+        changed or the heartbeat period elapsed since it was last printed.
+        """
+        if self._above:
+            self._write(self._flush_above(""))
+
+        text = self._resolve_text().strip()
+        now = time.monotonic()
+
+        if text == self._last_frame and now < self._next_heartbeat:
+            self._skipped_writes += 1
+            self._flush_owed()
+            return
+
+        self._last_frame = text
+        self._next_heartbeat = now + 0.001 * self._heartbeat
+
+        line = " ".join(part for part in (self._progress_summary(), text) if part)
+        if line:
+            self._write("{0}\n".format(line))
+
+    def _queue_above(self, text, stream=None):
+        """Queues text to be printed above the spinner on its next frame.
+        Parameters
+        ----------
+        text : str
+            Complete lines
+        stream : io, optional
+            Stream the text is meant for, defaults to the stream of the spinner
+        """
+        self._above.append((stream, text))
+
+    def _flush_above(self, prefix):
+        """Takes the text queued above the spinner. Text meant for another stream,
+        e.g. `sys.stderr`, is written there right away, after the prefix.
+        Parameters
+        ----------
+        prefix : str
+            Codes clearing the spinner
+        Returns
+        -------
+        str
+            Prefix and text to be written to the stream of the spinner
+        """
+        output = prefix
+        while True:
+            try:
+                stream, text = self._above.popleft()
+            except IndexError:
+                return output
+
+            if stream is None or stream is self._stream:
+                output += text
+                continue
+
+            # Clear the spinner before the text shows up on the other stream
+            self._write(output, flush=True)
+            output = ""
+            coordinator_for(stream).write(text, flush=True)
+
+    def _diff_frame(self, frame):
+        """Builds the output redrawing only the cells which changed since the
+        previous frame. Falls back to a full line if the previous frame is
+        unknown or a cell is wider than one column.
+        Parameters
+        ----------
+        frame : str
+            Frame to be drawn
+        Returns
+        -------
+        str
+            Output to be written
+        """
+        from halo._cells import diff_cells, is_single_width, split_cells
+
+        previous = self._last_cells
+        cells = split_cells(frame)
+        self._last_cells = cells if is_single_width(cells) else None
+
+        if previous is None or self._last_cells is None:
+            return "\r{0}{1}".format(self.CLEAR_LINE, frame)
+
+        return diff_cells(previous, cells)
 
     def render(self):
-        """Runs the render until thread flag is set.
+        """Blocks until the spinner is stopped. Started spinners are rendered
+        by the shared scheduler, so no frame is drawn here. Returns right away
+        if the spinner was never started.
         Returns
         -------
         self
         """
-        while not self._stop_spinner.is_set():
-            self._render_frame()
-            time.sleep(0.001 * self._interval)
+        if self._stop_spinner is not None:
+            self._stop_spinner.wait()
 
         return self
 
+    def _schedule(self):
+        """Registers the spinner with the shared render scheduler.
+        Returns
+        -------
+        str
+            Spinner id
+        """
+        return scheduler.register(self, 0.001 * self._interval)
+
+    def _unschedule(self):
+        """Unregisters the spinner from the shared render scheduler.
+        """
+        scheduler.unregister(self)
+
     def frame(self):
         """Builds and returns the frame to be rendered
         Returns
         -------
         self
         """
-        frames = self._spinner["frames"]
-        frame = frames[self._frame_index]
-
-        if self._color:
-            frame = colored_frame(frame, self._color)
+        frames = self._frames
+        # The spinner may be swapped from another thread while rendering
+        frame = frames[self._frame_index % len(frames)]
 
         self._frame_index += 1
         self._frame_index = self._frame_index % len(frames)
 
+        progress = self._progress_summary()
+        if progress:
+            # The progress sits next to the spinner, the text takes what is left
+            self._progress_width = len(progress) + 1
+            frame = (
+                "{0} {1}".format(progress, frame)
+                if self._placement == "right"
+                else "{0} {1}".format(frame, progress)
+            )
+
         text_frame = self.text_frame()
         return "{0} {1}".format(
             *[
@@ -453,26 +997,40 @@ class Halo(object):
         -------
         self
         """
-        if len(self._text["frames"]) == 1:
-            if self._text_color:
-                return colored_frame(self._text["frames"][0], self._text_color)
+        text = self._layout_text()
 
-            # Return first frame (can't return original text because at this point it might be ellipsed)
-            return self._text["frames"][0]
+        if text["count"] == 1:
+            # Return the only frame (can't return original text because at this point it might be ellipsed)
+            return text["colored"]
 
-        frames = self._text["frames"]
-        frame = frames[self._text_index]
+        # The text may have been replaced by one with fewer frames
+        index = self._text_index % text["count"]
+        frame = self._get_text_frame(index)
 
-        self._text_index += 1
-        self._text_index = self._text_index % len(frames)
+        self._text_index = (index + 1) % text["count"]
 
         if self._text_color:
             return colored_frame(frame, self._text_color)
 
         return frame
 
+    def update(self, n=1):
+        """Counts completed work. Only adds to a counter owned by the calling
+        thread, so it is cheap enough for hot loops and safe to call from any
+        thread. The summary is formatted when the next frame is rendered.
+        Parameters
+        ----------
+        n : int, optional
+            Amount of work completed
+        Returns
+        -------
+        self
+        """
+        self._progress.update(n)
+        return self
+
     def start(self, text=None):
-        """Starts the spinner on a separate thread.
+        """Starts the spinner on the shared render thread.
         Parameters
         ----------
         text : None, optional
@@ -492,12 +1050,18 @@ class Halo(object):
 
         self._hide_cursor()
 
+        if self._intercept_output:
+            from halo._intercept import intercept
+
+            self._proxies = intercept(self)
+
+        if self._stop_lock is None:
+            self._stop_lock = threading.RLock()
+
         self._stop_spinner = threading.Event()
-        self._spinner_thread = threading.Thread(target=self.render)
-        self._spinner_thread.daemon = True
         self._render_frame()
-        self._spinner_id = self._spinner_thread.name
-        self._spinner_thread.start()
+        self._spinner_id = self._schedule()
+        track_running(self)
 
         return self
 
@@ -507,12 +1071,27 @@ class Halo(object):
         -------
         self
         """
-        if self._spinner_thread and self._spinner_thread.is_alive():
+        if self._spinner_id is not None:
             self._stop_spinner.set()
-            self._spinner_thread.join()
+            self._unschedule()
+            untrack_running(self)
+        elif not self.enabled:
+            return self
+
+        if self._proxies is not None:
+            from halo._intercept import restore
+
+            restore(self._proxies)
+            self._proxies = None
 
         if self.enabled:
-            self.clear()
+            # Writers which see the spinner stopped wait for the lock, so
+            # their output starts on the cleared line
+            with self._stop_lock or contextlib.nullcontext():
+                self._spinner_id = None
+                self.clear()
+            if self._check_stream():
+                self._coordinator.flush()
 
         self._frame_index = 0
         self._spinner_id = None
@@ -529,7 +1108,7 @@ class Halo(object):
         -------
         self
         """
-        return self.stop_and_persist(symbol=LogSymbols.SUCCESS.value, text=text)
+        return self.stop_and_persist(symbol=get_log_symbol("success"), text=text)
 
     def fail(self, text=None):
         """Shows and persists fail symbol and text and exits.
@@ -541,7 +1120,7 @@ class Halo(object):
         -------
         self
         """
-        return self.stop_and_persist(symbol=LogSymbols.ERROR.value, text=text)
+        return self.stop_and_persist(symbol=get_log_symbol("error"), text=text)
 
     def warn(self, text=None):
         """Shows and persists warn symbol and text and exits.
@@ -553,7 +1132,7 @@ class Halo(object):
         -------
         self
         """
-        return self.stop_and_persist(symbol=LogSymbols.WARNING.value, text=text)
+        return self.stop_and_persist(symbol=get_log_symbol("warning"), text=text)
 
     def info(self, text=None):
         """Shows and persists info symbol and text and exits.
@@ -565,7 +1144,7 @@ class Halo(object):
         -------
         self
         """
-        return self.stop_and_persist(symbol=LogSymbols.INFO.value, text=text)
+        return self.stop_and_persist(symbol=get_log_symbol("info"), text=text)
 
     def stop_and_persist(self, symbol=" ", text=None):
         """Stops the spinner and persists the final frame to be shown.
@@ -588,7 +1167,7 @@ class Halo(object):
         if text is not None:
             text = decode_utf_8_text(text)
         else:
-            text = self._text["original"]
+            text = self._resolve_text()
 
         text = text.strip()
 
@@ -601,9 +1180,6 @@ class Halo(object):
             *[(text, symbol) if self._placement == "right" else (symbol, text)][0]
         )
 
-        try:
-            self._write(output)
-        except UnicodeEncodeError:
-            self._write(encode_utf_8_text(output))
+        self._write(output, flush=True)
 
         return self
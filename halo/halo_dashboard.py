@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""Spinner summarizing thousands of concurrent tasks.
+"""
+from __future__ import absolute_import, unicode_literals
+
+import collections
+import itertools
+import threading
+import time
+
+from array import array
+
+from halo._progress import format_duration
+from halo._utils import get_log_symbol, get_terminal_columns, get_terminal_lines
+from halo.halo_group import HaloGroup
+
+RUNNING = 0
+DONE = 1
+FAILED = 2
+
+
+class HaloDashboard(HaloGroup):
+    """Group drawing a window of the running tasks, oldest first, above a
+    summary line counting the running, done and failed tasks.
+
+    Tasks are plain indexes into arrays holding their state and start time,
+    so adding, updating or finishing one costs the same however many tasks
+    there are, and a redraw only visits the tasks which fit in the window.
+    Failed tasks are printed above the window, tasks which are done are
+    only counted.
+    """
+
+    def __init__(self, text="", max_lines=None, **kwargs):
+        """Constructs the HaloDashboard object.
+        Parameters
+        ----------
+        text : str|callable, optional
+            Text of the summary line
+        max_lines : int, optional
+            Lines of the window and the summary line. Defaults to the height of
+            the terminal.
+        **kwargs
+            Arguments of `Halo`
+        """
+        self._states = array("b")
+        self._started = array("d")
+        self._texts = []
+        # Running tasks in the order they were started, i.e. oldest first
+        self._running = collections.OrderedDict()
+        self._done = 0
+        self._failed = 0
+        self._hidden = 0
+        self._tasks_lock = threading.Lock()
+        self._max_lines = max_lines
+        super(HaloDashboard, self).__init__(text=text, **kwargs)
+
+    @property
+    def counts(self):
+        """Getter for the amount of tasks in each state.
+        Returns
+        -------
+        tuple
+            Running, done and failed tasks
+        """
+        return len(self._running), self._done, self._failed
+
+    def add_task(self, text=""):
+        """Starts a task.
+        Parameters
+        ----------
+        text : str, optional
+            Text of the task
+        Returns
+        -------
+        int
+            Task id
+        """
+        with self._tasks_lock:
+            task = len(self._texts)
+            self._texts.append(text)
+            self._states.append(RUNNING)
+            self._started.append(time.monotonic())
+            self._running[task] = None
+
+        return task
+
+    def set_task_text(self, task, text):
+        """Changes the text of a task.
+        Parameters
+        ----------
+        task : int
+            Task id
+        text : str
+            Text of the task
+        """
+        self._texts[task] = text
+
+    def task_text(self, task):
+        """Getter for the text of a task.
+        Parameters
+        ----------
+        task : int
+            Task id
+        Returns
+        -------
+        str
+            Text of the task
+        """
+        return self._texts[task]
+
+    def task_state(self, task):
+        """Getter for the state of a task.
+        Parameters
+        ----------
+        task : int
+            Task id
+        Returns
+        -------
+        int
+            `RUNNING`, `DONE` or `FAILED`
+        """
+        return self._states[task]
+
+    def succeed_task(self, task, text=None):
+        """Counts a task as done.
+        Parameters
+        ----------
+        task : int
+            Task id
+        text : str, optional
+            Final text of the task
+        """
+        self._finish_task(task, DONE, text)
+
+    def fail_task(self, task, text=None):
+        """Counts a task as failed and prints it above the window.
+        Parameters
+        ----------
+        task : int
+            Task id
+        text : str, optional
+            Final text of the task
+        """
+        if self._finish_task(task, FAILED, text):
+            self._write_row(
+                "{0} {1}\n".format(get_log_symbol("error"), self._texts[task].strip())
+            )
+
+    def _finish_task(self, task, state, text):
+        """Moves a running task to its final state.
+        Parameters
+        ----------
+        task : int
+            Task id
+        state : int
+            `DONE` or `FAILED`
+        text : str
+            Final text of the task, `None` to keep the text
+        Returns
+        -------
+        bool
+            Whether the task was running
+        """
+        if text is not None:
+            self._texts[task] = text
+
+        with self._tasks_lock:
+            if self._states[task] != RUNNING:
+                return False
+
+            self._states[task] = state
+            del self._running[task]
+            if state == DONE:
+                self._done += 1
+            else:
+                self._failed += 1
+
+        return True
+
+    def _progress_summary(self):
+        """Summarizes the tasks next to the spinner of the summary line.
+        Returns
+        -------
+        str
+            Counts of the tasks, after the progress counted with `update`
+        """
+        summary = "{0} running, {1} done, {2} failed".format(*self.counts)
+        if self._hidden:
+            summary = "{0} ({1} not shown)".format(summary, self._hidden)
+
+        progress = super(HaloDashboard, self)._progress_summary()
+        if progress:
+            return "{0} {1}".format(progress, summary)
+        return summary
+
+    def _region_lines(self, rows):
+        """Builds the lines of the rows, of as many of the oldest running tasks
+        as fit and of the summary line.
+        Parameters
+        ----------
+        rows : list
+            Running rows
+        Returns
+        -------
+        list
+            Lines of the region
+        """
+        lines = [row.frame() for row in rows]
+        # Leave a line for the cursor, so the region never scrolls
+        height = self._max_lines or get_terminal_lines() - 1
+        window = max(height - len(lines) - 1, 0)
+
+        with self._tasks_lock:
+            tasks = list(itertools.islice(self._running, window))
+            self._hidden = len(self._running) - len(tasks)
+
+        if tasks:
+            frames = self._frames
+            frame = frames[self._frame_index % len(frames)]
+            # Every task line fits on a line, so the region keeps its height
+            width = get_terminal_columns() - max(len(f) for f in self._spinner["frames"]) - 1
+            now = time.monotonic()
+
+            for task in tasks:
+                elapsed = " ({0})".format(format_duration(now - self._started[task]))
+                text = self._texts[task].strip()[: max(width - len(elapsed), 0)]
+                lines.append("{0} {1}{2}".format(frame, text, elapsed))
+
+        lines.append(self.frame())
+        return lines
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""Halo spinners sharing a region of lines, one line per task.
+"""
+from __future__ import absolute_import, unicode_literals
+
+import itertools
+import threading
+
+from halo.halo import Halo
+
+
+class HaloRow(Halo):
+    """Spinner drawn on a line of a `HaloGroup`. The group renders the row on
+    its own ticks and prints the line the row persists above its region.
+    """
+
+    def __init__(self, group, **kwargs):
+        """Constructs the HaloRow object.
+        Parameters
+        ----------
+        group : HaloGroup
+            Group drawing the row
+        **kwargs
+            Arguments of `Halo`
+        """
+        self._group = group
+        super(HaloRow, self).__init__(**kwargs)
+
+    def _schedule(self):
+        """Adds the row to the region of its group.
+        Returns
+        -------
+        str
+            Row id
+        """
+        return self._group._add_row(self)
+
+    def _unschedule(self):
+        """Removes the row from the region of its group.
+        """
+        self._group._remove_row(self)
+
+    def _render_frame(self):
+        """Frames of rows are composed and written by their group."""
+
+    def clear(self):
+        """Forgets the frame on the line, the group clears its region.
+        Returns
+        -------
+        self
+        """
+        self._last_frame = None
+        return self
+
+    def _hide_cursor(self):
+        """The group owns the cursor."""
+
+    def _show_cursor(self):
+        """The group owns the cursor."""
+
+    def _write(self, s, flush=False):
+        """Hands the output of the row, i.e. a persisted line, to the group.
+        Parameters
+        ----------
+        s : str
+            Characters to write to the stream
+        flush : bool, optional
+            Flush the stream regardless of the flush policy
+        """
+        self._group._write_row(s, flush=flush)
+
+
+class HaloGroup(Halo):
+    """Spinner owning a region of lines, one per row added with `add`. Every
+    tick redraws the whole region with a single write, moving the cursor up
+    to the start of the region and erasing it, so the group costs one write
+    and one registration with the shared render thread however many rows it
+    has. Lines persisted by rows, e.g. with `succeed`, are printed above the
+    region on the next tick, like the output intercepted while the group runs.
+
+    Rows are animated on the ticks of the group. If the group has a text, its
+    own spinner is drawn on the first line of the region.
+    """
+
+    ERASE_DOWN = "\033[J"
+
+    def __init__(self, text="", **kwargs):
+        """Constructs the HaloGroup object.
+        Parameters
+        ----------
+        text : str|callable, optional
+            Text of the line above the rows, none is drawn if empty
+        **kwargs
+            Arguments of `Halo`
+        """
+        self._rows = []
+        self._rows_lock = threading.Lock()
+        self._row_ids = itertools.count(1)
+        self._region_height = 0
+        super(HaloGroup, self).__init__(text=text, **kwargs)
+
+    def add(self, text="", **kwargs):
+        """Adds a row to the region.
+        Parameters
+        ----------
+        text : str|callable, optional
+            Text of the row
+        **kwargs
+            Further arguments of `Halo`, except for the stream
+        Returns
+        -------
+        HaloRow
+            Started row
+        """
+        kwargs.setdefault("color", self._color)
+        kwargs.setdefault("enabled", self.enabled)
+        kwargs.setdefault("mode", self._mode)
+
+        return HaloRow(self, text=text, stream=self._stream, **kwargs).start()
+
+    @property
+    def rows(self):
+        """Getter for the rows drawn in the region.
+        Returns
+        -------
+        list
+            Running rows
+        """
+        with self._rows_lock:
+            return list(self._rows)
+
+    def _add_row(self, row):
+        with self._rows_lock:
+            self._rows.append(row)
+        return "row-{0}".format(next(self._row_ids))
+
+    def _remove_row(self, row):
+        with self._rows_lock:
+            try:
+                self._rows.remove(row)
+            except ValueError:
+                pass
+
+    def _write_row(self, s, flush=False):
+        """Prints the output of a row above the region on the next tick, or
+        right away if no region is drawn.
+        Parameters
+        ----------
+        s : str
+            Characters written by the row
+        flush : bool, optional
+            Flush the stream regardless of the flush policy
+        """
+        if self._last_frame is None or self._get_render_mode() == "log":
+            self._write(s, flush=flush)
+        else:
+            self._queue_above(s)
+
+    def _region_start(self):
+        """Builds the codes moving the cursor to the start of the region and
+        erasing everything below.
+        Returns
+        -------
+        str
+            Escape codes
+        """
+        if self._region_height > 1:
+            return "\r\033[{0}A{1}".format(self._region_height - 1, self.ERASE_DOWN)
+        return "\r{0}".format(self.ERASE_DOWN)
+
+    def clear(self):
+        """Erases the region, after printing the lines persisted by rows.
+        Returns
+        -------
+        self
+        """
+        self._last_frame = None
+        if self._get_render_mode() == "log":
+            if self._above:
+                self._write(self._flush_above(""))
+            return self
+
+        self._write(self._flush_above(self._region_start()))
+        self._region_height = 0
+        return self
+
+    def _region_lines(self, rows):
+        """Builds the lines of the region, the line of the group if it has a
+        text followed by the frames of the rows.
+        Parameters
+        ----------
+        rows : list
+            Running rows
+        Returns
+        -------
+        list
+            Lines of the region
+        """
+        lines = [row.frame() for row in rows]
+        if self._text_value:
+            lines.insert(0, self.frame())
+        return lines
+
+    def _render_frame(self):
+        """Redraws the region with one write, printing the lines persisted
+        since the previous tick above it. Nothing is written if no line changed.
+        """
+        if not self.enabled:
+            return
+
+        rows = self.rows
+
+        if self._get_render_mode() == "log":
+            self._render_status_line()
+            for row in rows:
+                row._render_status_line()
+            return
+
+        lines = self._region_lines(rows)
+
+        frame = "\n".join(lines)
+        if not self._above and frame == self._last_frame:
+            self._skipped_writes += 1
+            self._flush_owed()
+            return
+
+        output = self._flush_above(self._region_start()) + frame
+        self._last_frame = frame
+        self._region_height = len(lines)
+        self._write(output)
+
+    def stop(self):
+        """Stops every row and the group, and erases the region.
+        Returns
+        -------
+        self
+        """
+        for row in self.rows:
+            row.stop()
+
+        return super(HaloGroup, self).stop()
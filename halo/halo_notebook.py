@@ -1,15 +1,39 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
+import html
+import itertools
 import sys
 import threading
 
 import halo.cursor as cursor
 
 from halo import Halo
+from halo._cleanup import track_running
 from halo._utils import colored_frame, decode_utf_8_text
 
+_ids = itertools.count(1)
+
+# Frames are stacked in a column one line high, which a CSS animation
+# scrolls through frame by frame, so the browser animates the spinner
+_FRONTEND_SPINNER = (
+    "<style>@keyframes {name} {{ to {{ transform: translateY(-{count}em); }} }}</style>"
+    '<span style="display: inline-block; height: 1em; overflow: hidden; '
+    'vertical-align: bottom; {color}">'
+    '<span style="display: inline-flex; flex-direction: column; '
+    'animation: {name} {duration}ms steps({count}) infinite">{frames}</span></span>'
+)
+_FRONTEND_FRAME = (
+    '<div style="font-family: monospace; line-height: 1em; white-space: pre; '
+    'overflow: hidden; text-overflow: ellipsis">{0} {1}</div>'
+)
+
+# termcolor colors whose CSS color has another name
+_CSS_COLORS = {"grey": "gray"}
+
 
 class HaloNotebook(Halo):
+    MODES = Halo.MODES + ("frontend",)
+
     def __init__(
         self,
         text="",
@@ -21,7 +45,12 @@ class HaloNotebook(Halo):
         interval=-1,
         enabled=True,
         stream=sys.stdout,
+        mode="auto",
     ):
+        """Constructs the HaloNotebook object. Takes the arguments of `Halo`,
+        and the `frontend` mode, in which the frames are sent to the browser
+        once and animated there, so updates are only sent when the text changes.
+        """
         super(HaloNotebook, self).__init__(
             text=text,
             color=color,
@@ -32,8 +61,10 @@ class HaloNotebook(Halo):
             interval=interval,
             enabled=enabled,
             stream=stream,
+            mode=mode,
         )
         self.output = self._make_output_widget()
+        self._animation_name = "halo-{0}".format(next(_ids))
 
     def _make_output_widget(self):
         from ipywidgets.widgets import Output
@@ -48,19 +79,94 @@ class HaloNotebook(Halo):
         if not self.enabled:
             return self
 
-        with self.output:
-            self.output.outputs += self._output("\r")
-            self.output.outputs += self._output(self.CLEAR_LINE)
-
+        self._last_frame = None
         self.output.outputs = self._output()
         self.output.close()
         return self
 
     def _render_frame(self):
+        """Replaces the only output of the widget with the frame, so every
+        update sends one frame to the frontend however long the spinner runs.
+        Nothing is sent if the frame is identical to the one already shown.
+        """
+        if self._mode == "frontend":
+            self._render_frontend_frame()
+            return
+
         frame = self.frame()
-        output = "\r{}".format(frame)
-        with self.output:
-            self.output.outputs += self._output(output)
+        if frame == self._last_frame:
+            self._skipped_writes += 1
+            return
+
+        self._last_frame = frame
+        self.output.outputs = self._output(frame)
+
+    def _render_frontend_frame(self):
+        """Sends the spinner, which the browser animates, whenever its text
+        changed. Nothing is sent on the other ticks.
+        """
+        text = self._frontend_text()
+        frame = self._frontend_frame(text)
+        if frame == self._last_frame:
+            self._skipped_writes += 1
+            return
+
+        self._last_frame = frame
+        self.output.outputs = self._html_output(frame, text)
+
+    def _html_output(self, markup, text=""):
+        return (
+            {
+                "output_type": "display_data",
+                "data": {"text/html": markup, "text/plain": text},
+                "metadata": {},
+            },
+        )
+
+    def _frontend_text(self):
+        """Builds the text shown next to the spinner animated by the browser
+        Returns
+        -------
+        str
+            Progress summary and text
+        """
+        text = self._resolve_text().strip()
+        return " ".join(part for part in (self._progress_summary(), text) if part)
+
+    def _frontend_frame(self, text):
+        """Builds the HTML of a spinner animated by the browser, which only
+        changes along with the text
+        Parameters
+        ----------
+        text : str
+            Text shown next to the spinner
+        Returns
+        -------
+        str
+            HTML of the spinner and its text
+        """
+        frames = self._spinner["frames"]
+        spinner = _FRONTEND_SPINNER.format(
+            name=self._animation_name,
+            count=len(frames),
+            duration=len(frames) * self._interval,
+            color=self._css_color(self._color),
+            frames="".join(
+                "<span>{0}</span>".format(html.escape(frame)) for frame in frames
+            ),
+        )
+        text = '<span style="{0}">{1}</span>'.format(
+            self._css_color(self._text_color), html.escape(text)
+        )
+
+        return _FRONTEND_FRAME.format(
+            *[(text, spinner) if self._placement == "right" else (spinner, text)][0]
+        )
+
+    def _css_color(self, color):
+        if not color:
+            return ""
+        return "color: {0}; font-weight: bold;".format(_CSS_COLORS.get(color, color))
 
     def start(self, text=None):
         if text is not None:
@@ -77,11 +183,9 @@ class HaloNotebook(Halo):
 
         display(self.output)
         self._stop_spinner = threading.Event()
-        self._spinner_thread = threading.Thread(target=self.render)
-        self._spinner_thread.daemon = True
         self._render_frame()
-        self._spinner_id = self._spinner_thread.name
-        self._spinner_thread.start()
+        self._spinner_id = self._schedule()
+        track_running(self)
 
         return self
 
@@ -106,7 +210,7 @@ class HaloNotebook(Halo):
         if text is not None:
             text = decode_utf_8_text(text)
         else:
-            text = self._text["original"]
+            text = self._resolve_text()
 
         text = text.strip()
 
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Logging handler printing records above a running spinner.
+"""
+from __future__ import absolute_import, unicode_literals
+
+import contextlib
+import logging
+
+
+class HaloLoggingHandler(logging.Handler):
+    """Handler writing records to the stream of a spinner. While the spinner
+    runs, formatted records are queued and printed above it with its next
+    frame, so a burst of records costs one clear and redraw per frame rather
+    than one per record. Queueing appends to a deque, so the handler does not
+    take its lock and threads logging at the same time do not wait on each other.
+
+    Parameters
+    ----------
+    spinner : Halo
+        Spinner the records are printed above
+    level : int, optional
+        Minimum level of the records handled
+    """
+
+    def __init__(self, spinner, level=logging.NOTSET):
+        super(HaloLoggingHandler, self).__init__(level)
+        self.spinner = spinner
+
+    def handle(self, record):
+        """Emits the record if the filters pass it, without taking the lock
+        of the handler, as queueing the record needs none.
+        Parameters
+        ----------
+        record : logging.LogRecord
+            Record to be handled
+        Returns
+        -------
+        logging.LogRecord|bool
+            Result of the filters
+        """
+        rv = self.filter(record)
+        # Filters may return a record to be emitted instead
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record):
+        """Queue the record above the spinner if it runs, or write it right away.
+        Parameters
+        ----------
+        record : logging.LogRecord
+            Record to be written
+        """
+        try:
+            line = "{0}\n".format(self.format(record))
+            spinner = self.spinner
+
+            if spinner.spinner_id is not None:
+                spinner._queue_above(line)
+                if spinner.spinner_id is not None:
+                    # Printed with the next frame, or when stop clears the line
+                    return
+                line = ""
+
+            # The spinner is stopped, or stopping. Once stop cleared the line,
+            # print the record there, along with any text stop left queued.
+            with spinner._stop_lock or contextlib.nullcontext():
+                output = spinner._flush_above("") + line if spinner._above else line
+                if output:
+                    spinner._write(output, flush=True)
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
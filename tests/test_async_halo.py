@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""This module tests AsyncHalo spinners.
+"""
+import asyncio
+import sys
+import threading
+import unittest
+
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from spinners.spinners import Spinners
+
+from halo import AsyncHalo
+from halo._utils import is_supported
+from tests._utils import strip_ansi, encode_utf_8_text, decode_utf_8_text
+
+if sys.version_info.major == 2:
+    get_coded_text = encode_utf_8_text
+else:
+    get_coded_text = decode_utf_8_text
+
+if is_supported():
+    frames = [get_coded_text(frame) for frame in Spinners['dots'].value['frames']]
+else:
+    frames = [get_coded_text(frame) for frame in Spinners['line'].value['frames']]
+
+
+class TestAsyncHalo(unittest.TestCase):
+    """Test AsyncHalo spinners.
+    """
+
+    def setUp(self):
+        """Set up things before beginning of each test.
+        """
+        self._stream = StringIO()
+
+    def _get_test_output(self):
+        """Clean the output from stream and return it in list form.
+
+        Returns
+        -------
+        list
+            Clean output from stream
+        """
+        lines = strip_ansi(self._stream.getvalue()).split('\r')
+        return [get_coded_text(line) for line in lines if line.strip('\n') != '']
+
+    def test_async_context_manager(self):
+        """Test frames are rendered by the event loop without any thread.
+        """
+        threads_before = threading.active_count()
+
+        async def main():
+            async with AsyncHalo(text='foo', spinner='dots', stream=self._stream, mode='line'):
+                await asyncio.sleep(0.5)
+                return threading.active_count()
+
+        threads_running = asyncio.run(main())
+        output = self._get_test_output()
+
+        self.assertEqual(threads_running, threads_before)
+        self.assertEqual(output[0], '{} foo'.format(frames[0]))
+        self.assertEqual(output[1], '{} foo'.format(frames[1]))
+        self.assertEqual(output[2], '{} foo'.format(frames[2]))
+
+    def test_decorator(self):
+        """Test AsyncHalo decorates coroutine functions.
+        """
+        spinner = AsyncHalo(text='foo', stream=self._stream, mode='line')
+
+        @spinner
+        async def decorated_function():
+            await asyncio.sleep(0.2)
+            return spinner.spinner_id
+
+        spinner_id = asyncio.run(decorated_function())
+
+        self.assertIsNotNone(spinner_id)
+        self.assertIsNone(spinner.spinner_id)
+        self.assertIn('{} foo'.format(frames[0]), self._get_test_output())
+
+    def test_cancellation(self):
+        """Test a cancelled task stops its spinner.
+        """
+        spinner = AsyncHalo(text='foo', stream=self._stream)
+
+        async def spin():
+            async with spinner:
+                await asyncio.sleep(10)
+
+        async def main():
+            task = asyncio.ensure_future(spin())
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+            written = len(self._stream.getvalue())
+            await asyncio.sleep(0.3)
+            return written
+
+        written = asyncio.run(main())
+
+        self.assertIsNone(spinner.spinner_id)
+        self.assertIsNone(spinner._handle)
+        self.assertEqual(len(self._stream.getvalue()), written)
+
+    def test_start_without_event_loop(self):
+        """Test starting outside of an event loop is an error.
+        """
+        spinner = AsyncHalo(text='foo', stream=self._stream)
+
+        with self.assertRaises(RuntimeError):
+            spinner.start()
+
+        self.assertEqual(self._stream.getvalue(), '')
+
+    def test_disabled_without_event_loop(self):
+        """Test disabled spinners start and stop outside of an event loop.
+        """
+        spinner = AsyncHalo(text='foo', stream=self._stream, enabled=False)
+
+        spinner.start()
+        spinner.succeed()
+
+        self.assertIsNone(spinner.spinner_id)
+        self.assertEqual(self._stream.getvalue(), '')
+
+    def test_decorate_plain_function(self):
+        """Test decorating a plain function, which would block the loop, is an error.
+        """
+        with self.assertRaises(TypeError):
+            AsyncHalo(text='foo', stream=self._stream)(lambda: None)
+
+
+if __name__ == '__main__':
+    SUITE = unittest.TestLoader().loadTestsFromTestCase(TestAsyncHalo)
+    unittest.TextTestRunner(verbosity=2).run(SUITE)
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""This module tests the coordination of writes to a shared stream.
+"""
+import os
+import re
+import signal
+import threading
+import time
+import unittest
+
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from halo import Halo
+from halo._coordinator import coordinator_for
+
+ESCAPE = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]')
+# Output made of whole frames and persisted lines only
+FRAMES = re.compile(r'^(?:\r|[-+] task \d+ \d+|(?:✔|v) task \d+ done\n)*$', re.UNICODE)
+
+
+class SlowStream(StringIO):
+    """StringIO writing in two halves, letting other threads run in between,
+    and counting the writes made to it."""
+
+    def __init__(self):
+        StringIO.__init__(self)
+        self.writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        half = len(s) // 2
+        StringIO.write(self, s[:half])
+        time.sleep(0)
+        StringIO.write(self, s[half:])
+        return len(s)
+
+
+class TestStreamCoordinator(unittest.TestCase):
+    """Test the coordinator shared by the spinners writing to a stream.
+    """
+
+    def setUp(self):
+        """Set up things before beginning of each test.
+        """
+        self._stream = SlowStream()
+
+    def test_shared_by_stream(self):
+        """Test spinners writing to the same stream share its coordinator.
+        """
+        first = Halo(stream=self._stream)
+        second = Halo(stream=self._stream)
+        other = Halo(stream=StringIO())
+
+        self.assertIs(first._coordinator, second._coordinator)
+        self.assertIsNot(first._coordinator, other._coordinator)
+        self.assertIs(first._coordinator, coordinator_for(self._stream))
+
+    def test_not_resolved_when_disabled(self):
+        """Test disabled spinners never look up the coordinator of their stream.
+        """
+        spinner = Halo(text='foo', stream=self._stream, enabled=False)
+        spinner.start()
+        spinner.text = 'bar'
+        spinner.succeed()
+
+        self.assertNotIn('_coordinator', vars(spinner))
+
+    def test_batches_waiting_writers(self):
+        """Test chunks queued while the stream is held are written in one call.
+        """
+        coordinator = coordinator_for(self._stream)
+        chunks = ['chunk {}\n'.format(i) for i in range(8)]
+
+        with coordinator.exclusive():
+            threads = [threading.Thread(target=coordinator.write, args=(chunk,))
+                       for chunk in chunks]
+            for thread in threads:
+                thread.start()
+            while len(coordinator._pending) < len(chunks):
+                time.sleep(0.001)
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self._stream.writes, 1)
+        self.assertEqual(sorted(self._stream.getvalue().splitlines(True)), sorted(chunks))
+
+    def test_no_torn_escape_sequences(self):
+        """Test frames written by 32 spinners and threads are never interleaved.
+        """
+        def run(n):
+            spinner = Halo(text='task {} 0'.format(n), stream=self._stream, mode='line',
+                           spinner={'interval': 10, 'frames': ['-', '+']})
+            spinner.start()
+            for i in range(20):
+                spinner.text = 'task {} {}'.format(n, i)
+                # Races the render thread drawing the same spinner
+                spinner._render_frame()
+                if i % 5 == 0:
+                    spinner.clear()
+            spinner.succeed('task {} done'.format(n))
+
+        threads = [threading.Thread(target=run, args=(n,)) for n in range(32)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        output = ESCAPE.sub('', self._stream.getvalue())
+        self.assertNotIn('\x1b', output)
+        self.assertRegex(output, FRAMES)
+        self.assertEqual(len(re.findall(r'task \d+ done\n', output)), 32)
+
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'fork is not available')
+    def test_fork_resets_lock(self):
+        """Test a child forked while the stream is held can write to it.
+        """
+        coordinator = coordinator_for(self._stream)
+
+        with coordinator.exclusive():
+            pid = os.fork()
+            if pid == 0:
+                # Killed by the alarm if the write deadlocks
+                signal.alarm(5)
+                coordinator.write('child\n')
+                os._exit(0 if self._stream.getvalue() == 'child\n' else 1)
+
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(status, 0)
+
+if __name__ == '__main__':
+    SUITE = unittest.TestLoader().loadTestsFromTestCase(TestStreamCoordinator)
+    unittest.TextTestRunner(verbosity=2).run(SUITE)
@@ -1,12 +1,20 @@
 # -*- coding: utf-8 -*-
 """This module tests Halo spinners.
 """
+import gc
 import io
 import os
 import re
+import signal
+import subprocess
 import sys
+import threading
 import time
+import tracemalloc
+import types
 import unittest
+import weakref
+from unittest import mock
 
 try:
     from cStringIO import StringIO
@@ -15,8 +23,11 @@ except ImportError:
 
 from spinners.spinners import Spinners
 
-from halo import Halo
-from halo._utils import get_terminal_columns, is_supported
+from halo import Halo, _cleanup
+from halo._progress import Progress
+from halo._scheduler import next_deadline
+from halo._utils import (TerminalColumns, colored_frame, colored_frames, get_terminal_columns,
+                         is_supported, terminal_columns)
 from tests._utils import strip_ansi, find_colors, encode_utf_8_text, decode_utf_8_text
 
 from termcolor import COLORS
@@ -38,6 +49,23 @@ class SpecificException(Exception):
     """A unique exc class we know only our tests would raise"""
 
 
+class CountingStream(StringIO):
+    """A stream counting the calls made to it"""
+
+    def __init__(self):
+        super(CountingStream, self).__init__()
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super(CountingStream, self).write(s)
+
+    def flush(self):
+        self.flushes += 1
+        return super(CountingStream, self).flush()
+
+
 class TestHalo(unittest.TestCase):
     """Test Halo enum for attribute values.
     """
@@ -84,7 +112,7 @@ class TestHalo(unittest.TestCase):
     def test_basic_spinner(self):
         """Test the basic of basic spinners.
         """
-        spinner = Halo(text='foo', spinner='dots', stream=self._stream)
+        spinner = Halo(text='foo', spinner='dots', stream=self._stream, mode='line')
 
         spinner.start()
         time.sleep(1)
@@ -107,7 +135,8 @@ class TestHalo(unittest.TestCase):
                 text_color=color,
                 color=color,
                 spinner='dots',
-                stream=self._stream
+                stream=self._stream,
+                mode='line'
             )
 
             spinner.start()
@@ -144,7 +173,7 @@ class TestHalo(unittest.TestCase):
     def test_text_stripping(self):
         """Test the text being stripped before output.
         """
-        spinner = Halo(text='foo\n', spinner='dots', stream=self._stream)
+        spinner = Halo(text='foo\n', spinner='dots', stream=self._stream, mode='line')
 
         spinner.start()
         time.sleep(1)
@@ -165,7 +194,7 @@ class TestHalo(unittest.TestCase):
         text = 'This is a text that it is too long. In fact, it exceeds the eighty column standard ' \
                'terminal width, which forces the text frame renderer to add an ellipse at the end of the ' \
                'text. ' * 6
-        spinner = Halo(text=text, spinner='dots', stream=self._stream)
+        spinner = Halo(text=text, spinner='dots', stream=self._stream, mode='line')
 
         spinner.start()
         time.sleep(1)
@@ -189,7 +218,7 @@ class TestHalo(unittest.TestCase):
         text = 'This is a text that it is too long. In fact, it exceeds the eighty column standard ' \
                'terminal width, which forces the text frame renderer to add an ellipse at the end of the ' \
                'text. ' * 6
-        spinner = Halo(text=text, spinner='dots', stream=self._stream, animation='marquee')
+        spinner = Halo(text=text, spinner='dots', stream=self._stream, animation='marquee', mode='line')
 
         spinner.start()
         time.sleep(1)
@@ -209,7 +238,7 @@ class TestHalo(unittest.TestCase):
     def test_context_manager(self):
         """Test the basic of basic spinners used through the with statement.
         """
-        with Halo(text='foo', spinner='dots', stream=self._stream):
+        with Halo(text='foo', spinner='dots', stream=self._stream, mode='line'):
             time.sleep(1)
         output = self._get_test_output()['text']
 
@@ -227,7 +256,7 @@ class TestHalo(unittest.TestCase):
     def test_decorator_spinner(self):
         """Test basic usage of spinners with the decorator syntax."""
 
-        @Halo(text="foo", spinner="dots", stream=self._stream)
+        @Halo(text="foo", spinner="dots", stream=self._stream, mode='line')
         def decorated_function():
             time.sleep(1)
 
@@ -250,7 +279,7 @@ class TestHalo(unittest.TestCase):
     def test_initial_title_spinner(self):
         """Test Halo with initial title.
         """
-        spinner = Halo('bar', stream=self._stream)
+        spinner = Halo('bar', stream=self._stream, mode='line')
 
         spinner.start()
         time.sleep(1)
@@ -285,6 +314,45 @@ class TestHalo(unittest.TestCase):
         self.assertIsNotNone(spinner_id)
         spinner.stop()
 
+    def test_spinners_share_render_thread(self):
+        """Test many running spinners are driven by a single thread.
+        """
+        threads_before = threading.active_count()
+        spinners = [Halo(text='foo', stream=self._stream).start() for _ in range(50)]
+        time.sleep(0.2)
+        threads_running = threading.active_count()
+        spinner_ids = set(spinner.spinner_id for spinner in spinners)
+
+        for spinner in spinners:
+            spinner.stop()
+
+        self.assertLessEqual(threads_running - threads_before, 1)
+        self.assertEqual(len(spinner_ids), 50)
+
+    def test_stop_latency(self):
+        """Test stop does not wait for the current frame interval to elapse
+        """
+        latencies = []
+        for _ in range(5):
+            spinner = Halo(text='foo', interval=1000, stream=self._stream_no_tty)
+            spinner.start()
+            time.sleep(0.05)
+
+            started = time.monotonic()
+            spinner.stop()
+            latencies.append(time.monotonic() - started)
+
+        self.assertLess(sorted(latencies)[2], 0.005)
+
+    def test_next_deadline(self):
+        """Test frames keep a fixed cadence and late frames are dropped
+        """
+        # on time: the cadence does not drift by the render time
+        self.assertEqual(next_deadline(10.0, 0.5, 10.2), 10.5)
+        # late: missed frames are skipped instead of being bunched up
+        self.assertEqual(next_deadline(10.0, 0.5, 10.5), 11.0)
+        self.assertEqual(next_deadline(10.0, 0.5, 11.7), 12.0)
+
     def test_succeed(self):
         """Test succeed method
         """
@@ -411,6 +479,42 @@ class TestHalo(unittest.TestCase):
         self.assertEqual(len(output), 0)
         self.assertEqual(output, [])
 
+    def test_disabled_spinner_deferred(self):
+        """Test disabled spinners resolve their spinner only once it is needed
+        """
+        spinner = Halo(text='foo', spinner='line', enabled=False, stream=self._stream)
+        self.assertNotIn('_spinner', vars(spinner))
+
+        spinner.start()
+        spinner.text = 'bar'
+        spinner.succeed()
+        self.assertNotIn('_spinner', vars(spinner))
+        self.assertEqual(self._get_test_output()['text'], [])
+
+        self.assertEqual(spinner._interval, Spinners['line'].value['interval'])
+        self.assertEqual(spinner.spinner, Spinners['line'].value)
+
+        spinner.enabled = True
+        spinner.mode = 'line'
+        self.assertEqual(strip_ansi(spinner.frame()), '- bar')
+
+        with self.assertRaises(AttributeError):
+            spinner.missing
+
+    def test_disabled_by_environment(self):
+        """Test the HALO_DISABLE environment variable disables spinners
+        """
+        with mock.patch.dict(os.environ, {'HALO_DISABLE': '1'}):
+            spinner = Halo(text='foo', stream=self._stream)
+            spinner.start()
+            spinner.succeed()
+
+        self.assertFalse(spinner.enabled)
+        self.assertEqual(self._get_test_output()['text'], [])
+
+        with mock.patch.dict(os.environ, {'HALO_DISABLE': '0'}):
+            self.assertTrue(Halo(text='foo', stream=self._stream).enabled)
+
     def test_writing_disabled_on_closed_stream(self):
         """Test no I/O is performed on closed streams
         """
@@ -528,7 +632,7 @@ class TestHalo(unittest.TestCase):
     def test_right_placement(self):
         """Test right placement of spinner.
         """
-        spinner = Halo(text='foo', placement='right', stream=self._stream)
+        spinner = Halo(text='foo', placement='right', stream=self._stream, mode='line')
         spinner.start()
         time.sleep(1)
 
@@ -571,7 +675,7 @@ class TestHalo(unittest.TestCase):
             "{} {}".format(frames[idx % frames.__len__()], frame)
             for idx, frame in enumerate(expected_frames_without_appended_spinner)
         ]
-        spinner = Halo(text, animation="bounce", stream=self._stream)
+        spinner = Halo(text, animation="bounce", stream=self._stream, mode='line')
         spinner.start()
         # Sleep a full bounce cycle
         time.sleep(1.2)
@@ -583,6 +687,165 @@ class TestHalo(unittest.TestCase):
             expected_frame, actual_frame = multiple_frames
             self.assertEqual(expected_frame, actual_frame)
 
+    def test_animation_frames_computed_on_demand(self):
+        """Test animation frames sliced on demand match the full frame lists
+        """
+        spinner = Halo(spinner={'interval': 100, 'frames': ['-']})
+        text = ''.join(chr(ord('a') + i % 26) for i in range(get_terminal_columns() + 7))
+
+        spinner.animation = 'bounce'
+        spinner.text = text
+        width = spinner._layout_text()['width']
+        expected = [text[x:x + width] for x in range(len(text) - width + 1)]
+        expected += list(reversed(expected))
+        self.assertNotIn('frames', spinner._text)
+        self.assertEqual([spinner.text_frame() for _ in expected], expected)
+
+        spinner.animation = 'marquee'
+        scrolled = text + ' ' + text[:width]
+        expected = [scrolled[x:x + width] for x in range(len(text) + 1)]
+        self.assertEqual([spinner.text_frame() for _ in expected], expected)
+        self.assertEqual(spinner.text_frame(), expected[0])
+
+    @unittest.skipUnless(hasattr(signal, 'SIGWINCH'), 'SIGWINCH is not available')
+    def test_terminal_columns_cached(self):
+        """Test the terminal size is only queried again after a resize
+        """
+        columns = TerminalColumns()
+        size = os.terminal_size((100, 24))
+
+        with mock.patch('shutil.get_terminal_size', return_value=size) as get_terminal_size:
+            try:
+                self.assertEqual(columns.get(), 100)
+                self.assertEqual(columns.get(), 100)
+                self.assertEqual(get_terminal_size.call_count, 1)
+
+                os.kill(os.getpid(), signal.SIGWINCH)
+                get_terminal_size.return_value = os.terminal_size((120, 24))
+                self.assertEqual(columns.get(), 120)
+                self.assertEqual(get_terminal_size.call_count, 2)
+
+                # A handler installed later replaces ours, so the cache expires
+                signal.signal(signal.SIGWINCH, signal.SIG_DFL)
+                columns._expires = 0
+                self.assertEqual(columns.get(), 120)
+                self.assertFalse(columns._watching)
+                self.assertEqual(signal.getsignal(signal.SIGWINCH), signal.SIG_DFL)
+                get_terminal_size.return_value = os.terminal_size((90, 24))
+                with mock.patch('time.monotonic', return_value=time.monotonic() + 2):
+                    self.assertEqual(columns.get(), 90)
+            finally:
+                signal.signal(signal.SIGWINCH, columns._previous_handler or signal.SIG_DFL)
+
+    def test_text_relayout_on_resize(self):
+        """Test the text is laid out again once the terminal width changed
+        """
+        spinner = Halo(text='x' * 150, spinner={'interval': 100, 'frames': ['-']})
+
+        with mock.patch('shutil.get_terminal_size') as get_terminal_size:
+            try:
+                for width in (60, 120):
+                    get_terminal_size.return_value = os.terminal_size((width, 24))
+                    terminal_columns._expires = 0
+                    self.assertEqual(spinner.text_frame(), 'x' * (width - 8) + ' (...)')
+            finally:
+                terminal_columns._expires = 0
+
+    def test_callable_text(self):
+        """Test a callable text is only evaluated when a frame is rendered
+        """
+        calls = []
+
+        def text():
+            calls.append(None)
+            return 'call {}'.format(len(calls))
+
+        spinner = Halo(text=text, spinner={'interval': 100, 'frames': ['-']})
+        self.assertIs(spinner.text, text)
+        self.assertEqual(calls, [])
+
+        self.assertEqual(spinner.frame(), '\x1b[1m\x1b[36m-\x1b[0m call 1')
+        self.assertEqual(strip_ansi(spinner.frame()), '- call 2')
+        self.assertEqual(len(calls), 2)
+
+    def test_text_template(self):
+        """Test template fields are looked up when a frame is rendered
+        """
+        state = types.SimpleNamespace(done=0, total=10)
+        spinner = Halo(text='{done}/{total} files', text_fields=state, stream=self._stream, mode='line')
+
+        for _ in range(4):
+            state.done += 1
+        self.assertEqual(strip_ansi(spinner.frame())[2:], '4/10 files')
+
+        spinner.text_fields = {'done': 10, 'total': 10}
+        spinner.succeed()
+        pattern = re.compile(r'(✔|v) 10/10 files', re.UNICODE)
+        self.assertRegex(self._get_test_output()['text'][-1], pattern)
+
+        spinner.text_fields = None
+        self.assertEqual(strip_ansi(spinner.frame())[2:], '{done}/{total} files')
+
+    def test_progress_update(self):
+        """Test updates from several threads are counted and shown next to the spinner
+        """
+        spinner = Halo(text='files', spinner={'interval': 100, 'frames': ['-']}, total=40)
+        self.assertEqual(strip_ansi(spinner.frame()), '- 0/40 0% files')
+
+        def work():
+            for _ in range(5):
+                spinner.update()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        spinner.update(10)
+
+        self.assertEqual(spinner.done, 30)
+        self.assertEqual(strip_ansi(spinner.frame()), '- 30/40 75% files')
+        # The text gives up the room taken by the summary
+        self.assertEqual(spinner._layout_text()['reserved'], len('30/40 75%') + 1)
+
+    def test_progress_counter(self):
+        """Test progress without a total is only shown once work is counted
+        """
+        spinner = Halo(text='files', spinner={'interval': 100, 'frames': ['-']}, placement='right')
+        self.assertEqual(strip_ansi(spinner.frame()), 'files -')
+
+        spinner.update(3)
+        self.assertEqual(strip_ansi(spinner.frame()), 'files 3 -')
+
+    def test_progress_rate_and_eta(self):
+        """Test the rate is a moving average sampled when the summary is rendered
+        """
+        progress = Progress(total=100)
+        self.assertEqual(progress.summary(0.0), '0/100 0%')
+
+        progress.update(10)
+        self.assertEqual(progress.summary(1.0), '10/100 10% 10/s ETA 0:09')
+
+        progress.update(40)
+        # Too early for another sample
+        self.assertEqual(progress.summary(1.1), '50/100 50% 10/s ETA 0:05')
+        self.assertEqual(progress.summary(2.0), '50/100 50% 19/s ETA 0:03')
+        self.assertAlmostEqual(progress.rate, 19.0)
+
+        progress.update(50)
+        self.assertEqual(progress.summary(3.0), '100/100 100% 28/s')
+
+    def test_progress_log_mode(self):
+        """Test the progress is printed with the status line
+        """
+        spinner = Halo(text='files', stream=self._stream, mode='log', total=2)
+        spinner.start()
+        spinner.update(2)
+        spinner.stop()
+
+        output = self._get_test_output(no_ansi=False)['text']
+        self.assertEqual(output[0], '0/2 0% files')
+
     def test_animation_setter(self):
         spinner = Halo("Asdf")
         spinner.animation = "bounce"
@@ -596,7 +859,7 @@ class TestHalo(unittest.TestCase):
 
         for color, color_int in COLORS.items():
             self._stream = io.open(self._stream_file, 'w+')  # reset stream
-            spinner = Halo(color=color, stream=self._stream)
+            spinner = Halo(color=color, stream=self._stream, mode='line')
             spinner.start()
             spinner.stop()
 
@@ -605,6 +868,173 @@ class TestHalo(unittest.TestCase):
 
             self.assertEqual(str(color_int) in output_merged, True)
 
+    def test_colored_frames_cached(self):
+        """Test colored frames are computed once and shared between spinners
+        """
+        spinner = Halo(text='foo', text_color='red', color='green', stream=self._stream)
+        other = Halo(text='foo', text_color='red', color='green', stream=self._stream)
+
+        self.assertIs(spinner._frames, other._frames)
+        self.assertEqual(spinner._layout_text()['colored'], other._layout_text()['colored'])
+        self.assertIn('32', [c.strip('[m') for c in find_colors(spinner.frame())])
+
+        spinner.color = 'blue'
+        spinner.text_color = None
+        frame = spinner.frame()
+        self.assertEqual(['34'], [c.strip('[m') for c in find_colors(frame)])
+        self.assertTrue(frame.endswith(' foo'))
+
+    def test_text_not_cached_with_frames(self):
+        """Test changing a colored text does not evict the colored spinner frames
+        """
+        spinner = Halo(text='foo', text_color='red', color='green', stream=self._stream)
+        spinner.frame()
+        cached = colored_frames.cache_info()
+
+        for i in range(200):
+            spinner.text = 'item {}'.format(i)
+            spinner.frame()
+
+        self.assertEqual(colored_frames.cache_info().currsize, cached.currsize)
+        self.assertEqual(colored_frames.cache_info().misses, cached.misses)
+
+    def test_single_write_per_frame(self):
+        """Test every frame is written and flushed with a single call each
+        """
+        stream = CountingStream()
+        spinner = Halo(text='foo', stream=stream, mode='line')
+
+        for _ in range(5):
+            spinner._render_frame()
+
+        self.assertEqual(stream.writes, 5)
+        self.assertEqual(stream.flushes, 5)
+        self.assertEqual(stream.getvalue().count('\r'), 5)
+
+    def test_unchanged_frames_skipped(self):
+        """Test frames identical to the one on the line are not written again
+        """
+        stream = CountingStream()
+        spinner = Halo(text='foo', spinner={'interval': 10, 'frames': ['+']}, stream=stream, mode='line')
+
+        for _ in range(5):
+            spinner._render_frame()
+
+        self.assertEqual(stream.writes, 1)
+        self.assertEqual(spinner.skipped_writes, 4)
+
+        spinner.text = 'bar'
+        spinner._render_frame()
+        self.assertEqual(stream.writes, 2)
+
+        spinner.clear()
+        spinner._render_frame()
+        self.assertEqual(stream.writes, 4)
+        self.assertEqual(spinner.skipped_writes, 4)
+
+    def test_diff_mode(self):
+        """Test diff mode only redraws the cells which changed
+        """
+        stream = StringIO()
+        spinner = Halo(text='item 9', color=None, spinner={'interval': 10, 'frames': ['-', '+']},
+                       stream=stream, mode='diff')
+
+        def render():
+            stream.seek(0)
+            stream.truncate()
+            spinner._render_frame()
+            return stream.getvalue()
+
+        self.assertEqual(render(), '\r\033[K- item 9')
+        self.assertEqual(render(), '\033[1G+')
+
+        spinner.text = 'item 10'
+        self.assertEqual(render(), '\033[1G-\033[8G10')
+
+        spinner.text = 'it'
+        self.assertEqual(render(), '\033[1G+\033[5G\033[K')
+
+        spinner.clear()
+        self.assertEqual(render(), '\r\033[K- it')
+
+        with self.assertRaises(ValueError):
+            Halo(mode='foo')
+
+    def test_flush_policy(self):
+        """Test the stream is flushed as the flush policy says
+        """
+        stream = CountingStream()
+        spinner = Halo(text='foo', stream=stream, flush_policy='never', mode='line')
+        for _ in range(5):
+            spinner._render_frame()
+        self.assertEqual(stream.flushes, 0)
+
+        spinner.succeed()
+        self.assertGreater(stream.flushes, 0)
+
+        stream = CountingStream()
+        spinner = Halo(text='foo', stream=stream, flush_policy=60000, mode='line')
+        for _ in range(5):
+            spinner._render_frame()
+        self.assertEqual(stream.writes, 5)
+        self.assertEqual(stream.flushes, 1)
+
+        # A changed frame written within the flush period is flushed by the
+        # first unchanged frame after the period
+        stream = CountingStream()
+        spinner = Halo(text='foo', stream=stream, flush_policy=200, mode='line',
+                       spinner={'interval': 100, 'frames': ['-']})
+        spinner._render_frame()
+        spinner.text = 'bar'
+        spinner._render_frame()
+        for _ in range(5):
+            spinner._render_frame()
+        self.assertEqual((stream.writes, stream.flushes), (2, 1))
+
+        time.sleep(0.25)
+        for _ in range(5):
+            spinner._render_frame()
+        self.assertEqual((stream.writes, stream.flushes), (2, 2))
+
+        for policy in ('sometimes', -1, None):
+            with self.assertRaises(ValueError):
+                Halo(flush_policy=policy)
+
+    def test_invalid_mode(self):
+        """Test modes of other spinners are rejected
+        """
+        with self.assertRaises(ValueError):
+            Halo(mode='frontend')
+
+    def test_log_mode(self):
+        """Test streams which are not terminals get plain status lines
+        """
+        spinner = Halo(text='foo', stream=self._stream_no_tty, interval=10)
+        spinner.start()
+        time.sleep(0.2)
+        spinner.text = 'bar'
+        time.sleep(0.2)
+        spinner.succeed('done')
+
+        output = self._stream_no_tty.getvalue()
+        self.assertNotIn('\r', output)
+        self.assertNotIn(Halo.CLEAR_LINE, output)
+        self.assertEqual(strip_ansi(output).splitlines()[:2], ['foo', 'bar'])
+        self.assertRegex(strip_ansi(output).splitlines()[2], re.compile(r'(✔|v) done', re.UNICODE))
+        self.assertEqual(len(output.splitlines()), 3)
+
+    def test_log_mode_heartbeat(self):
+        """Test unchanged status lines are repeated after the heartbeat period
+        """
+        spinner = Halo(text='foo', stream=self._stream, mode='log', heartbeat=100)
+        spinner._render_frame()
+        spinner._render_frame()
+        time.sleep(0.15)
+        spinner._render_frame()
+
+        self.assertEqual(self._get_test_output()['text'], ['foo', 'foo'])
+        self.assertEqual(spinner.skipped_writes, 1)
+
     def test_redirect_stdout(self):
         """Test redirect stdout
         """
@@ -622,6 +1052,130 @@ class TestHalo(unittest.TestCase):
 
         self.assertIn('foo', output[0])
 
+    def test_cleanup_registry(self):
+        """Test created spinners are not kept alive and the cleanup hook only
+        stops running spinners
+        """
+        tracemalloc.start()
+        for _ in range(1000):
+            Halo(text='foo', stream=self._stream)
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+
+        for _ in range(100000):
+            Halo(text='foo', stream=self._stream)
+        gc.collect()
+        grown = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+
+        self.assertLess(grown, 64 * 1024)
+
+        stopped = Halo(text='foo', stream=self._stream, mode='line').start()
+        stopped.stop()
+        stopped = weakref.ref(stopped)
+        self.assertIsNone(stopped())
+
+        running = [Halo(text='foo', stream=self._stream, mode='line').start() for _ in range(3)]
+        with mock.patch.object(Halo, 'stop', autospec=True, side_effect=Halo.stop) as stop:
+            _cleanup.stop_running()
+
+        self.assertEqual(stop.call_count, len(running))
+        self.assertEqual(len(_cleanup._running), 0)
+
+    def test_intercept_output(self):
+        """Test output printed while spinning is written above the spinner with its next frame
+        """
+        stdout = CountingStream()
+        frames = {'interval': 10000, 'frames': ['-']}
+
+        with mock.patch('sys.stdout', stdout):
+            spinner = Halo(text='foo', spinner=frames, stream=sys.stdout, mode='line', intercept_output=True)
+            spinner.start()
+            self.assertIsNot(sys.stdout, stdout)
+
+            for i in range(100):
+                print('line {}'.format(i))
+            print('partial', end='')
+            writes = stdout.writes
+            spinner._render_frame()
+
+            self.assertEqual(stdout.writes, writes + 1)
+            spinner.stop()
+            self.assertIs(sys.stdout, stdout)
+
+        output = stdout.getvalue()
+        lines = ''.join('line {}\n'.format(i) for i in range(100))
+        frame = '{} foo'.format(colored_frame('-', 'cyan'))
+        self.assertEqual(output, '\r\x1b[K{0}\r\x1b[K{1}{0}\r\x1b[Kpartial'.format(frame, lines))
+
+    def test_intercept_other_stream(self):
+        """Test output intercepted for another stream is written there, after clearing the spinner
+        """
+        stdout, stderr = CountingStream(), StringIO()
+
+        with mock.patch('sys.stdout', stdout), mock.patch('sys.stderr', stderr):
+            spinner = Halo(text='foo', spinner={'interval': 10000, 'frames': ['-']},
+                           stream=sys.stdout, mode='line', intercept_output=True)
+            spinner.start()
+            print('out')
+            sys.stderr.write('err\n')
+            spinner._render_frame()
+            stdout_value = stdout.getvalue()
+            spinner.stop()
+            self.assertIs(sys.stderr, stderr)
+
+        self.assertEqual(stderr.getvalue(), 'err\n')
+        self.assertTrue(strip_ansi(stdout_value).endswith('\rout\n- foo'))
+
+    def test_lazy_imports(self):
+        """Test importing halo does not import optional or costly modules
+        """
+        lazy_modules = ('asyncio', 'IPython', 'spinners', 'log_symbols', 'termcolor', 'colorama')
+        output = subprocess.check_output(
+            [sys.executable, '-c', 'import sys, halo; print(" ".join(sys.modules))'],
+            cwd=os.path.dirname(self.TEST_FOLDER),
+            universal_newlines=True,
+        )
+        self.assertEqual([m for m in lazy_modules if m in output.split()], [])
+
+    def test_global_streams_untouched(self):
+        """Test using halo does not replace sys.stdout or sys.stderr
+        """
+        script = '; '.join([
+            'import sys',
+            'streams = (sys.stdout, sys.stderr)',
+            'from halo import Halo',
+            'Halo(text="foo", color="red", stream=sys.stderr).start().succeed()',
+            'print((sys.stdout, sys.stderr) == streams)',
+        ])
+        output = subprocess.check_output(
+            [sys.executable, '-c', script],
+            cwd=os.path.dirname(self.TEST_FOLDER),
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        )
+        self.assertEqual(output.strip(), 'True')
+
+    def test_render_blocks_until_stopped(self):
+        """Test render waits for the spinner to stop without drawing frames itself
+        """
+        spinner = Halo(text='foo', stream=CountingStream(), mode='line',
+                       spinner={'interval': 100, 'frames': ['-']})
+        self.assertIs(spinner.render(), spinner)
+
+        spinner.start()
+        with mock.patch.object(spinner, '_render_frame') as render_frame:
+            thread = threading.Thread(target=spinner.render)
+            thread.start()
+            time.sleep(0.2)
+            self.assertTrue(thread.is_alive())
+            spinner.stop()
+            thread.join(1)
+
+        self.assertFalse(thread.is_alive())
+        # Frames drawn meanwhile come from the scheduler thread only
+        self.assertLessEqual(render_frame.call_count, 3)
+
     def tearDown(self):
         pass
 
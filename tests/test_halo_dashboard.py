@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""This module tests HaloDashboard spinners.
+"""
+import re
+import threading
+import unittest
+from unittest import mock
+
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from halo import HaloDashboard
+from halo import halo_dashboard
+from tests._utils import strip_ansi
+
+
+class TestHaloDashboard(unittest.TestCase):
+    """Test HaloDashboard spinners.
+    """
+
+    def setUp(self):
+        """Set up things before beginning of each test.
+        """
+        self._stream = StringIO()
+
+    def _render_lines(self, dashboard):
+        """Render a frame of the dashboard and return its lines without escape codes.
+
+        Returns
+        -------
+        list
+            Lines of the region
+        """
+        self._stream.seek(0)
+        self._stream.truncate()
+        dashboard._render_frame()
+        return strip_ansi(self._stream.getvalue()).lstrip('\r').split('\n')
+
+    def _dashboard(self, **kwargs):
+        return HaloDashboard(text='crawling', stream=self._stream, mode='line', max_lines=10,
+                             spinner={'interval': 100, 'frames': ['-']}, **kwargs)
+
+    def test_window_of_oldest_tasks(self):
+        """Test only the oldest running tasks which fit are drawn, above the summary.
+        """
+        dashboard = self._dashboard()
+        tasks = [dashboard.add_task('task {}'.format(i)) for i in range(5000)]
+        for task in tasks[:3]:
+            dashboard.succeed_task(task)
+        dashboard.set_task_text(tasks[5], 'renamed')
+
+        lines = self._render_lines(dashboard)
+
+        self.assertEqual(len(lines), 10)
+        self.assertEqual(lines[0], '- task 3 (0:00)')
+        self.assertEqual(lines[2], '- renamed (0:00)')
+        self.assertEqual(lines[8], '- task 11 (0:00)')
+        self.assertEqual(lines[9], '- 4997 running, 3 done, 0 failed (4988 not shown) crawling')
+
+    def test_redraw_visits_window_only(self):
+        """Test the cost of a redraw depends on the window, not on the tasks.
+        """
+        dashboard = self._dashboard()
+        for i in range(100000):
+            dashboard.add_task('task {}'.format(i))
+
+        with mock.patch.object(halo_dashboard, 'format_duration',
+                               wraps=halo_dashboard.format_duration) as format_duration:
+            self._render_lines(dashboard)
+
+        self.assertEqual(format_duration.call_count, 9)
+
+    def test_failed_tasks_printed_above(self):
+        """Test failed tasks are printed above the window and counted.
+        """
+        dashboard = self._dashboard()
+        first = dashboard.add_task('first')
+        dashboard.add_task('second')
+        self._render_lines(dashboard)
+
+        dashboard.fail_task(first, 'first broke')
+        dashboard.fail_task(first)
+        lines = self._render_lines(dashboard)
+
+        self.assertRegex(lines[0], re.compile(r'(✖|×) first broke', re.UNICODE))
+        self.assertEqual(lines[1:], ['- second (0:00)', '- 1 running, 0 done, 1 failed crawling'])
+        self.assertEqual(dashboard.task_state(first), halo_dashboard.FAILED)
+        self.assertEqual(dashboard.counts, (1, 0, 1))
+
+    def test_tasks_from_threads(self):
+        """Test tasks are added and finished from many threads.
+        """
+        dashboard = self._dashboard()
+
+        def work():
+            for i in range(1000):
+                dashboard.succeed_task(dashboard.add_task('task {}'.format(i)))
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(dashboard.counts, (0, 8000, 0))
+        self.assertEqual(self._render_lines(dashboard), ['- 0 running, 8000 done, 0 failed crawling'])
+
+
+if __name__ == '__main__':
+    SUITE = unittest.TestLoader().loadTestsFromTestCase(TestHaloDashboard)
+    unittest.TextTestRunner(verbosity=2).run(SUITE)
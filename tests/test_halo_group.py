@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""This module tests HaloGroup spinners.
+"""
+import re
+import time
+import unittest
+
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from halo import HaloGroup
+from halo._scheduler import scheduler
+from tests._utils import strip_ansi
+
+
+class CountingStream(StringIO):
+    """StringIO counting the writes made to it."""
+
+    def __init__(self):
+        StringIO.__init__(self)
+        self.writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return StringIO.write(self, s)
+
+
+class TestHaloGroup(unittest.TestCase):
+    """Test HaloGroup spinners.
+    """
+
+    def setUp(self):
+        """Set up things before beginning of each test.
+        """
+        self._stream = CountingStream()
+
+    def _reset_stream(self):
+        """Empty the stream and reset its write count.
+        """
+        self._stream.seek(0)
+        self._stream.truncate()
+        self._stream.writes = 0
+
+    def test_one_write_per_tick(self):
+        """Test all rows are redrawn with a single write.
+        """
+        group = HaloGroup(stream=self._stream, mode='line')
+        rows = [group.add(text='task {}'.format(i), spinner={'interval': 100, 'frames': ['-', '+']})
+                for i in range(5)]
+
+        group._render_frame()
+        self.assertEqual(self._stream.writes, 1)
+        self.assertEqual(strip_ansi(self._stream.getvalue()).lstrip('\r').split('\n'),
+                         ['- task {}'.format(i) for i in range(5)])
+
+        self._reset_stream()
+        group._render_frame()
+        self.assertEqual(self._stream.writes, 1)
+        # Back to the first line of the region, then erase it
+        self.assertTrue(self._stream.getvalue().startswith('\r\x1b[4A\x1b[J'))
+        self.assertEqual(len(rows), len(group.rows))
+
+    def test_rows_share_group_registration(self):
+        """Test only the group is registered with the render thread.
+        """
+        group = HaloGroup(stream=self._stream, mode='line').start()
+        rows = [group.add(text='task {}'.format(i)) for i in range(10)]
+        time.sleep(0.3)
+
+        try:
+            self.assertIn(group, scheduler._entries)
+            for row in rows:
+                self.assertIsNotNone(row.spinner_id)
+                self.assertNotIn(row, scheduler._entries)
+        finally:
+            group.stop()
+
+        self.assertEqual(group.rows, [])
+        for row in rows:
+            self.assertIsNone(row.spinner_id)
+
+    def test_persisted_above_region(self):
+        """Test lines persisted by rows are printed above the remaining rows.
+        """
+        group = HaloGroup(text='tasks', stream=self._stream, mode='line',
+                          spinner={'interval': 100, 'frames': ['*']})
+        done = group.add(text='first', spinner={'interval': 100, 'frames': ['-']})
+        group.add(text='second', spinner={'interval': 100, 'frames': ['-']})
+        group._render_frame()
+
+        done.succeed()
+        self.assertEqual(group.rows[0].text, 'second')
+
+        self._reset_stream()
+        group._render_frame()
+        output = self._stream.getvalue()
+
+        self.assertEqual(self._stream.writes, 1)
+        self.assertTrue(output.startswith('\r\x1b[2A\x1b[J'))
+        lines = strip_ansi(output).split('\n')
+        self.assertRegex(lines[0], re.compile(r'(✔|v) first', re.UNICODE))
+        self.assertEqual(lines[1:], ['* tasks', '- second'])
+
+    def test_stop_erases_region(self):
+        """Test stopping the group stops the rows and erases the region.
+        """
+        group = HaloGroup(stream=self._stream, mode='line')
+        rows = [group.add(text='task {}'.format(i)) for i in range(3)]
+        group._render_frame()
+        rows[0].fail()
+
+        self._reset_stream()
+        group.stop()
+        output = self._stream.getvalue()
+
+        self.assertTrue(output.startswith('\r\x1b[2A\x1b[J'))
+        self.assertRegex(strip_ansi(output), re.compile(r'(✖|×) task 0\n$', re.UNICODE))
+        self.assertEqual(group.rows, [])
+
+    def test_log_mode(self):
+        """Test rows print plain status lines when the stream is no terminal.
+        """
+        group = HaloGroup(stream=self._stream)
+        group.add(text='first')
+        group.add(text='second').succeed()
+        group._render_frame()
+        group.stop()
+
+        lines = strip_ansi(self._stream.getvalue()).split('\n')
+        self.assertRegex(lines[0], re.compile(r'(✔|v) second', re.UNICODE))
+        self.assertEqual(lines[1], 'first')
+
+
+if __name__ == '__main__':
+    SUITE = unittest.TestLoader().loadTestsFromTestCase(TestHaloGroup)
+    unittest.TextTestRunner(verbosity=2).run(SUITE)
@@ -6,6 +6,7 @@ import re
 import sys
 import time
 import unittest
+from unittest import mock
 
 from spinners.spinners import Spinners
 
@@ -35,12 +36,23 @@ class TestHaloNotebook(unittest.TestCase):
     TEST_FOLDER = os.path.dirname(os.path.abspath(__file__))
 
     def setUp(self):
-        """Set up things before beginning of each test.
+        """Set up things before beginning of each test. Frames replace each
+        other in the Output widget, so the widgets record every output shown.
         """
-        pass
+        make_output_widget = HaloNotebook._make_output_widget
+
+        def make_recording_output_widget(spinner):
+            widget = make_output_widget(spinner)
+            widget.history = []
+            widget.observe(lambda change: widget.history.extend(change['new']), names='outputs')
+            return widget
+
+        patcher = mock.patch.object(HaloNotebook, '_make_output_widget', make_recording_output_widget)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def _get_test_output(self, spinner, no_ansi=True):
-        """Clean the output from Output widget and return it in list form.
+        """Clean the outputs shown by the Output widget and return them in list form.
 
         Returns
         -------
@@ -51,7 +63,7 @@ class TestHaloNotebook(unittest.TestCase):
         output_text = []
         output_colors = []
 
-        for line in spinner.output.outputs:
+        for line in spinner.output.history:
             if no_ansi:
                 clean_line = strip_ansi(line['text'].strip('\r'))
             else:
@@ -87,6 +99,57 @@ class TestHaloNotebook(unittest.TestCase):
         self.assertEqual(output[2], '{} foo'.format(frames[2]))
         self.assertEqual(spinner.output.outputs, spinner._output(''))
 
+    def test_single_output_slot(self):
+        """Test frames replace each other instead of piling up in the outputs.
+        """
+        spinner = HaloNotebook(text='foo', spinner='dots')
+
+        spinner.start()
+        time.sleep(1)
+        outputs = spinner.output.outputs
+        spinner.stop()
+
+        self.assertEqual(len(outputs), 1)
+        self.assertEqual(strip_ansi(outputs[0]['text']), self._get_test_output(spinner)['text'][-1])
+
+    def test_unchanged_frames_not_sent(self):
+        """Test nothing is sent to the frontend while the frame is unchanged.
+        """
+        spinner = HaloNotebook(text='foo', spinner={'interval': 10, 'frames': ['-']})
+
+        spinner.start()
+        time.sleep(0.2)
+        spinner.stop()
+
+        self.assertEqual(len(self._get_test_output(spinner)['text']), 1)
+        self.assertGreater(spinner.skipped_writes, 0)
+
+    def test_frontend_mode(self):
+        """Test the frames are sent once and updates only when the text changes.
+        """
+        spinner = HaloNotebook(text='foo <1>', spinner='dots', mode='frontend')
+
+        spinner.start()
+        time.sleep(0.5)
+        spinner.text = 'bar'
+        time.sleep(0.5)
+        shown = list(spinner.output.history)
+        spinner.stop()
+
+        self.assertEqual(len(shown), 2)
+        self.assertEqual(shown[0]['data']['text/plain'], 'foo <1>')
+        self.assertEqual(shown[1]['data']['text/plain'], 'bar')
+
+        markup = shown[0]['data']['text/html']
+        self.assertIn('foo &lt;1&gt;', markup)
+        self.assertIn('steps({})'.format(len(frames)), markup)
+        self.assertIn('{}ms'.format(len(frames) * default_spinner['interval']), markup)
+        for frame in frames:
+            self.assertIn('<span>{}</span>'.format(frame), markup)
+
+        self.assertGreater(spinner.skipped_writes, 0)
+        self.assertEqual(spinner.output.outputs, spinner._output(''))
+
     def test_text_spinner_color(self):
         """Test basic spinner with available colors color (both spinner and text)
         """
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""This module tests HaloLoggingHandler.
+"""
+import logging
+import threading
+import time
+import unittest
+from unittest import mock
+
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from halo import Halo, HaloLoggingHandler
+from tests._utils import strip_ansi
+
+
+class CountingStream(StringIO):
+    """StringIO counting the writes made to it."""
+
+    def __init__(self):
+        StringIO.__init__(self)
+        self.writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return StringIO.write(self, s)
+
+
+class TestHaloLoggingHandler(unittest.TestCase):
+    """Test HaloLoggingHandler.
+    """
+
+    def setUp(self):
+        """Set up things before beginning of each test.
+        """
+        self._stream = CountingStream()
+        self._logger = logging.getLogger('halo.tests.{0}'.format(self.id()))
+        self._logger.propagate = False
+        self._logger.setLevel(logging.INFO)
+
+    def _add_handler(self, spinner):
+        handler = HaloLoggingHandler(spinner)
+        handler.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+        self._logger.addHandler(handler)
+        self.addCleanup(self._logger.removeHandler, handler)
+        return handler
+
+    def test_written_when_not_running(self):
+        """Test records are written right away while the spinner is stopped.
+        """
+        spinner = Halo(text='foo', stream=self._stream, mode='line')
+        self._add_handler(spinner)
+
+        self._logger.info('bar')
+        self.assertEqual(self._stream.getvalue(), 'INFO bar\n')
+
+    def test_burst_costs_one_redraw(self):
+        """Test records logged by many threads are printed with one write.
+        """
+        spinner = Halo(text='foo', stream=self._stream, mode='line',
+                       spinner={'interval': 100000, 'frames': ['-']})
+        handler = self._add_handler(spinner)
+        handler.lock = mock.MagicMock()
+
+        spinner.start()
+        try:
+            def log(thread):
+                for i in range(1000):
+                    self._logger.info('%d-%d', thread, i)
+
+            threads = [threading.Thread(target=log, args=(n,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self._stream.seek(0)
+            self._stream.truncate()
+            self._stream.writes = 0
+            spinner._render_frame()
+            writes, output = self._stream.writes, self._stream.getvalue()
+        finally:
+            spinner.stop()
+
+        self.assertEqual(writes, 1)
+        self.assertEqual(handler.lock.mock_calls, [])
+        lines = strip_ansi(output).lstrip('\r').split('\n')
+        self.assertEqual(lines[-1], '- foo')
+        self.assertEqual(sorted(lines[:-1]),
+                         sorted('INFO {0}-{1}'.format(n, i) for n in range(8) for i in range(1000)))
+
+    def test_printed_on_stop(self):
+        """Test records queued before the spinner stops are not lost.
+        """
+        spinner = Halo(text='foo', stream=self._stream, mode='line',
+                       spinner={'interval': 100000, 'frames': ['-']})
+        self._add_handler(spinner)
+
+        spinner.start()
+        self._logger.warning('bar')
+        spinner.stop()
+
+        self.assertIn('WARNING bar\n', strip_ansi(self._stream.getvalue()))
+        self.assertFalse(spinner._above)
+
+
+    def test_logged_while_stopping(self):
+        """Test a record logged while stop clears the line is printed below it.
+        """
+        spinner = Halo(text='foo', stream=self._stream, mode='line',
+                       color=None, spinner={'interval': 100000, 'frames': ['-']})
+        self._add_handler(spinner)
+        spinner.start()
+
+        clear = spinner.clear
+        threads = []
+
+        def slow_clear():
+            # Another thread logs once the spinner is marked stopped, but
+            # before its frame is cleared from the line
+            thread = threading.Thread(target=self._logger.info, args=('bar',))
+            thread.start()
+            threads.append(thread)
+            time.sleep(0.1)
+            return clear()
+
+        with mock.patch.object(spinner, 'clear', side_effect=slow_clear):
+            spinner.stop()
+        threads[0].join()
+
+        self.assertEqual(self._stream.getvalue(), '\r\x1b[K- foo\r\x1b[KINFO bar\n')
+        self.assertFalse(spinner._above)
+
+
+if __name__ == '__main__':
+    SUITE = unittest.TestLoader().loadTestsFromTestCase(TestHaloLoggingHandler)
+    unittest.TextTestRunner(verbosity=2).run(SUITE)
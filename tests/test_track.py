@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""This module tests tracking iterables with spinners.
+"""
+import asyncio
+import itertools
+import re
+import time
+import unittest
+
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import halo
+from halo import Halo
+from halo._track import Tracked, track
+from tests._utils import strip_ansi
+
+
+class TestTrack(unittest.TestCase):
+    """Test tracking iterables.
+    """
+
+    def setUp(self):
+        """Set up things before beginning of each test.
+        """
+        self._stream = StringIO()
+
+    def _get_last_line(self):
+        """Return the last line written to the stream, without escape codes.
+
+        Returns
+        -------
+        str
+            Last line of the output
+        """
+        lines = strip_ansi(self._stream.getvalue()).replace('\r', '\n').split('\n')
+        return [line for line in lines if line.strip()][-1]
+
+    def test_items_counted(self):
+        """Test every item is yielded and counted.
+        """
+        spinner = Halo(text='items', stream=self._stream, total=100000)
+
+        self.assertEqual(sum(Tracked(spinner, range(100000))), sum(range(100000)))
+        self.assertEqual(spinner.done, 100000)
+        self.assertIsNone(spinner.spinner_id)
+
+    def test_succeed_when_exhausted(self):
+        """Test the spinner succeeds once the iterable is exhausted.
+        """
+        items = list(track([1, 2, 3], text='items', stream=self._stream))
+
+        self.assertEqual(items, [1, 2, 3])
+        self.assertRegex(self._get_last_line(), re.compile(r'(✔|v) items', re.UNICODE))
+
+    def test_fail_when_raised(self):
+        """Test the spinner fails if the iterable raises.
+        """
+        def broken():
+            yield 1
+            raise ValueError('broken')
+
+        with self.assertRaises(ValueError):
+            list(track(broken(), text='items', stream=self._stream))
+
+        self.assertRegex(self._get_last_line(), re.compile(r'(✖|×) items', re.UNICODE))
+
+    def test_stop_when_closed_early(self):
+        """Test the spinner is stopped without a symbol if the loop ends early.
+        """
+        spinner = Halo(text='items', stream=self._stream, mode='line')
+        items = iter(Tracked(spinner, range(10)))
+
+        for item in items:
+            if item == 3:
+                break
+        items.close()
+
+        # The item the loop broke on was not finished
+        self.assertEqual(spinner.done, 3)
+        self.assertIsNone(spinner.spinner_id)
+        self.assertNotRegex(self._stream.getvalue(), re.compile(r'✔|✖', re.UNICODE))
+
+    def test_stop_when_body_raises(self):
+        """Test the spinner is stopped, not failed, if the body of the loop raises.
+        """
+        spinner = Halo(text='items', stream=self._stream, mode='line')
+
+        with self.assertRaises(ValueError):
+            for item in Tracked(spinner, range(10)):
+                if item == 3:
+                    raise ValueError('broken')
+
+        self.assertEqual(spinner.done, 3)
+        self.assertIsNone(spinner.spinner_id)
+        self.assertNotRegex(self._stream.getvalue(), re.compile(r'✔|✖', re.UNICODE))
+
+    def test_async_iterable(self):
+        """Test async iterables are tracked from the event loop.
+        """
+        async def numbers():
+            for number in range(5):
+                await asyncio.sleep(0)
+                yield number
+
+        async def main():
+            return [number async for number in track(numbers(), text='items', stream=self._stream)]
+
+        self.assertEqual(asyncio.run(main()), [0, 1, 2, 3, 4])
+        self.assertRegex(self._get_last_line(), re.compile(r'(✔|v) items', re.UNICODE))
+
+    def test_fail_when_block_raises(self):
+        """Test the spinner fails if the body of the loop raises within the block.
+        """
+        with self.assertRaises(ValueError):
+            with track(range(10), text='items', stream=self._stream) as items:
+                for item in items:
+                    if item == 3:
+                        raise ValueError('broken')
+
+        self.assertEqual(items.spinner.done, 3)
+        self.assertRegex(self._get_last_line(), re.compile(r'(✖|×) items', re.UNICODE))
+
+    def test_block_ends_early(self):
+        """Test the spinner is stopped without a symbol if the block ends early.
+        """
+        with track(range(10), text='items', stream=self._stream, mode='line') as items:
+            for item in items:
+                if item == 3:
+                    break
+
+        self.assertIsNone(items.spinner.spinner_id)
+        self.assertNotRegex(self._stream.getvalue(), re.compile(r'✔|✖', re.UNICODE))
+
+    def test_block_succeeds_once(self):
+        """Test an exhausted iterable succeeds, however the block ends afterwards.
+        """
+        with self.assertRaises(ValueError):
+            with track([1, 2], text='items', stream=self._stream) as items:
+                self.assertEqual(list(items), [1, 2])
+                raise ValueError('after the loop')
+
+        self.assertRegex(self._get_last_line(), re.compile(r'(✔|v) items', re.UNICODE))
+        self.assertNotRegex(self._stream.getvalue(), re.compile(r'✖', re.UNICODE))
+
+    def test_async_block_raises(self):
+        """Test the spinner of an async iterable fails if the async block raises.
+        """
+        async def numbers():
+            for number in range(5):
+                await asyncio.sleep(0)
+                yield number
+
+        async def main():
+            async with track(numbers(), text='items', stream=self._stream) as items:
+                async for number in items:
+                    if number == 2:
+                        raise ValueError('broken')
+
+        with self.assertRaises(ValueError):
+            asyncio.run(main())
+
+        self.assertRegex(self._get_last_line(), re.compile(r'(✖|×) items', re.UNICODE))
+
+    def test_count_never_stale(self):
+        """Test slow items are counted right away after a burst of fast ones.
+        """
+        spinner = Halo(text='items', stream=self._stream, mode='line')
+        items = iter(Tracked(spinner, itertools.chain(range(300000), range(5))))
+
+        for _ in range(300000):
+            next(items)
+        for i in range(5):
+            next(items)
+            time.sleep(0.01)
+            # The item just taken is counted once the next one is taken
+            self.assertEqual(spinner.done, 300000 + i)
+        items.close()
+
+    def test_lazy_attribute(self):
+        """Test track is exposed by the package.
+        """
+        self.assertIs(halo.track, track)
+
+
+if __name__ == '__main__':
+    SUITE = unittest.TestLoader().loadTestsFromTestCase(TestTrack)
+    unittest.TextTestRunner(verbosity=2).run(SUITE)